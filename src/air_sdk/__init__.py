@@ -15,8 +15,10 @@ to browse individual modules:
 
 from __future__ import annotations
 
+import logging
 from datetime import timedelta
-from typing import TYPE_CHECKING
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
 
 from air_sdk import const
 from air_sdk.bc.decorators import deprecated
@@ -74,6 +76,7 @@ __all__ = [
 ]
 
 
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
 
 from air_sdk.exceptions import AirError, AirModelAttributeError
@@ -90,6 +93,7 @@ from air_sdk.types import (
 if TYPE_CHECKING:
     from air_sdk.bc import CloudInitEndpointAPI
     from air_sdk.endpoints import (
+        Checkpoint,
         CheckpointEndpointAPI,
         FleetEndpointAPI,
         HistoryEndpointAPI,
@@ -102,11 +106,16 @@ if TYPE_CHECKING:
         MarketplaceDemoTagEndpointAPI,
         NodeEndpointAPI,
         NodeInstructionEndpointAPI,
+        Organization,
         OrganizationEndpointAPI,
+        ResourceBudget,
+        ResourceBudgetEndpointAPI,
         ServiceEndpointAPI,
         SimulationEndpointAPI,
+        SSHKey,
         SSHKeyEndpointAPI,
         SystemEndpointAPI,
+        Training,
         TrainingEndpointAPI,
         UserConfigEndpointAPI,
         WorkerClientCertificateEndpointAPI,
@@ -114,12 +123,31 @@ if TYPE_CHECKING:
         ZTPScriptEndpointAPI,
     )
 
-
-try:
-    __version__ = version('nvidia-air-sdk')
-except PackageNotFoundError:
-    # package is not installed
-    __version__ = 'unknown'
+    # Static mirrors of the lazily resolved aliases in ``_DYNAMIC_IMPORTS``
+    SimulationApi = SimulationEndpointAPI
+    SimulationEndpointApi = SimulationEndpointAPI
+    ImageApi = ImageEndpointAPI
+    ImageEndpointApi = ImageEndpointAPI
+    ServiceAPI = ServiceEndpointAPI
+    ServiceEndpointApi = ServiceEndpointAPI
+    MarketplaceDemoApi = MarketplaceDemoEndpointAPI
+    MarketplaceDemoEndpointApi = MarketplaceDemoEndpointAPI
+    MarketplaceDemoTagApi = MarketplaceDemoTagEndpointAPI
+    InterfaceApi = InterfaceEndpointAPI
+    InterfaceEndpointApi = InterfaceEndpointAPI
+    SimulationInterfaceApi = InterfaceEndpointAPI
+    LinkApi = LinkEndpointAPI
+    LinkEndpointApi = LinkEndpointAPI
+    SSHKeyApi = SSHKeyEndpointAPI
+    SimulationNodeApi = NodeEndpointAPI
+    NodeEndpointApi = NodeEndpointAPI
+    NodeApi = NodeEndpointAPI
+    UserConfigAPI = UserConfigEndpointAPI
+    UserConfigEndpointApi = UserConfigEndpointAPI
+    OrganizationApi = OrganizationEndpointAPI
+
+
+logger = logging.getLogger(__name__)
 
 
 class AirApi:
@@ -198,57 +226,60 @@ class AirApi:
         try:
             auto_sak = self.client.hunt_for_sak()
             if auto_sak:
-                censored_sak = f'{"*" * (len(auto_sak) - 3)}{auto_sak[-3:]}'
-                print(f'Using auto-detected SAK found at ~/.ngc/config: {censored_sak}')  # noqa: T201
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        'Using auto-detected SAK found at ~/.ngc/config: %s',
+                        auto_sak[-3:].rjust(len(auto_sak), '*'),
+                    )
                 self.client.headers.update({'Authorization': f'Bearer {auto_sak}'})
             else:
                 raise AirError(err_msg)
         except AirError:
             raise AirError(err_msg)
 
-    @property
+    @cached_property
     def checkpoints(self) -> CheckpointEndpointAPI:
         from .endpoints import CheckpointEndpointAPI
 
         return CheckpointEndpointAPI(self)
 
-    @property
+    @cached_property
     def histories(self) -> HistoryEndpointAPI:
         from .endpoints import HistoryEndpointAPI
 
         return HistoryEndpointAPI(self)
 
-    @property
+    @cached_property
     def images(self) -> ImageEndpointAPI:
         from .endpoints import ImageEndpointAPI
 
         return ImageEndpointAPI(self)
 
-    @property
+    @cached_property
     def image_shares(self) -> ImageShareEndpointAPI:
         from .endpoints import ImageShareEndpointAPI
 
         return ImageShareEndpointAPI(self)
 
-    @property
+    @cached_property
     def simulations(self) -> SimulationEndpointAPI:
         from .endpoints import SimulationEndpointAPI
 
         return SimulationEndpointAPI(self)
 
-    @property
+    @cached_property
     def systems(self) -> SystemEndpointAPI:
         from .endpoints import SystemEndpointAPI
 
         return SystemEndpointAPI(self)
 
-    @property
+    @cached_property
     def nodes(self) -> NodeEndpointAPI:
         from .endpoints import NodeEndpointAPI
 
         return NodeEndpointAPI(self)
 
-    @property
+    @cached_property
     def interfaces(self) -> InterfaceEndpointAPI:
         from .endpoints import InterfaceEndpointAPI
 
@@ -268,13 +299,13 @@ class AirApi:
             'and interface.revert_breakout() to revert them.'
         )
 
-    @property
+    @cached_property
     def links(self) -> LinkEndpointAPI:
         from .endpoints import LinkEndpointAPI
 
         return LinkEndpointAPI(self)
 
-    @property
+    @cached_property
     def services(self) -> ServiceEndpointAPI:
         from .endpoints import ServiceEndpointAPI
 
@@ -285,7 +316,7 @@ class AirApi:
     def simulation_interfaces(self) -> InterfaceEndpointAPI:
         return self.interfaces
 
-    @property
+    @cached_property
     def node_instructions(self) -> NodeInstructionEndpointAPI:
         from .endpoints import NodeInstructionEndpointAPI
 
@@ -296,55 +327,55 @@ class AirApi:
     def simulation_nodes(self) -> NodeEndpointAPI:
         return self.nodes
 
-    @property
+    @cached_property
     def ztp_scripts(self) -> ZTPScriptEndpointAPI:
         from .endpoints import ZTPScriptEndpointAPI
 
         return ZTPScriptEndpointAPI(self)
 
-    @property
+    @cached_property
     def workers(self) -> WorkerEndpointAPI:
         from .endpoints import WorkerEndpointAPI
 
         return WorkerEndpointAPI(self)
 
-    @property
+    @cached_property
     def worker_client_certificates(self) -> WorkerClientCertificateEndpointAPI:
         from .endpoints import WorkerClientCertificateEndpointAPI
 
         return WorkerClientCertificateEndpointAPI(self)
 
-    @property
+    @cached_property
     def fleets(self) -> FleetEndpointAPI:
         from .endpoints import FleetEndpointAPI
 
         return FleetEndpointAPI(self)
 
-    @property
+    @cached_property
     def marketplace_demos(self) -> MarketplaceDemoEndpointAPI:
         from .endpoints import MarketplaceDemoEndpointAPI
 
         return MarketplaceDemoEndpointAPI(self)
 
-    @property
+    @cached_property
     def marketplace_demo_tags(self) -> MarketplaceDemoTagEndpointAPI:
         from .endpoints import MarketplaceDemoTagEndpointAPI
 
         return MarketplaceDemoTagEndpointAPI(self)
 
-    @property
+    @cached_property
     def ssh_keys(self) -> SSHKeyEndpointAPI:
         from .endpoints import SSHKeyEndpointAPI
 
         return SSHKeyEndpointAPI(self)
 
-    @property
+    @cached_property
     def trainings(self) -> TrainingEndpointAPI:
         from .endpoints import TrainingEndpointAPI
 
         return TrainingEndpointAPI(self)
 
-    @property
+    @cached_property
     def manifests(self) -> ManifestEndpointAPI:
         from .endpoints import ManifestEndpointAPI
 
@@ -358,17 +389,22 @@ class AirApi:
     )
     def cloud_inits(self) -> CloudInitEndpointAPI:
         """Cloud-init endpoint for V2 backwards compatibility."""
+        return self._cloud_init_endpoint
+
+    @cached_property
+    def _cloud_init_endpoint(self) -> CloudInitEndpointAPI:
+        """Shared cloud-init endpoint, also used by Node.cloud_init without warning."""
         from .bc import CloudInitEndpointAPI
 
         return CloudInitEndpointAPI(self)
 
-    @property
+    @cached_property
     def user_configs(self) -> UserConfigEndpointAPI:
         from .endpoints import UserConfigEndpointAPI
 
         return UserConfigEndpointAPI(self)
 
-    @property
+    @cached_property
     def organizations(self) -> OrganizationEndpointAPI:
         """Organization / Resource Budget endpoint."""
         from .endpoints import OrganizationEndpointAPI
@@ -484,50 +520,86 @@ class AirApi:
             raise AirError('Pagination page size must be a positive integer.')
 
 
-# Backward compatibility aliases (defined after AirApi to avoid circular imports)
-from air_sdk.endpoints import (  # noqa: E402
-    Checkpoint,
-    CheckpointEndpointAPI,
-    ImageEndpointAPI,
-    InterfaceEndpointAPI,
-    LinkEndpointAPI,
-    MarketplaceDemoEndpointAPI,
-    MarketplaceDemoTagEndpointAPI,
-    NodeEndpointAPI,
-    Organization,
-    OrganizationEndpointAPI,
-    ResourceBudget,  # alias for Organization
-    ResourceBudgetEndpointAPI,  # alias for OrganizationEndpointAPI
-    ServiceEndpointAPI,
-    SimulationEndpointAPI,
-    SSHKey,
-    SSHKeyEndpointAPI,
-    Training,
-    TrainingEndpointAPI,
-    UserConfigEndpointAPI,
-)
+# Endpoint classes and their backward compatibility aliases are resolved lazily by
+# the module-level ``__getattr__`` below, so ``import air_sdk`` does not pull in the
+# whole ``air_sdk.endpoints`` package until one of these names is actually used.
+_DYNAMIC_IMPORTS: dict[str, tuple[str, str]] = {
+    'Checkpoint': ('air_sdk.endpoints', 'Checkpoint'),
+    'CheckpointEndpointAPI': ('air_sdk.endpoints', 'CheckpointEndpointAPI'),
+    'ImageEndpointAPI': ('air_sdk.endpoints', 'ImageEndpointAPI'),
+    'ImageShareEndpointAPI': ('air_sdk.endpoints', 'ImageShareEndpointAPI'),
+    'InterfaceEndpointAPI': ('air_sdk.endpoints', 'InterfaceEndpointAPI'),
+    'LinkEndpointAPI': ('air_sdk.endpoints', 'LinkEndpointAPI'),
+    'MarketplaceDemoEndpointAPI': ('air_sdk.endpoints', 'MarketplaceDemoEndpointAPI'),
+    'MarketplaceDemoTagEndpointAPI': (
+        'air_sdk.endpoints',
+        'MarketplaceDemoTagEndpointAPI',
+    ),
+    'NodeEndpointAPI': ('air_sdk.endpoints', 'NodeEndpointAPI'),
+    'Organization': ('air_sdk.endpoints', 'Organization'),
+    'OrganizationEndpointAPI': ('air_sdk.endpoints', 'OrganizationEndpointAPI'),
+    'ServiceEndpointAPI': ('air_sdk.endpoints', 'ServiceEndpointAPI'),
+    'SimulationEndpointAPI': ('air_sdk.endpoints', 'SimulationEndpointAPI'),
+    'SSHKey': ('air_sdk.endpoints', 'SSHKey'),
+    'SSHKeyEndpointAPI': ('air_sdk.endpoints', 'SSHKeyEndpointAPI'),
+    'SystemEndpointAPI': ('air_sdk.endpoints', 'SystemEndpointAPI'),
+    'Training': ('air_sdk.endpoints', 'Training'),
+    'TrainingEndpointAPI': ('air_sdk.endpoints', 'TrainingEndpointAPI'),
+    'UserConfigEndpointAPI': ('air_sdk.endpoints', 'UserConfigEndpointAPI'),
+}
+
+# Backward compatibility aliases, resolved through their canonical name above
+_BC_ALIASES: dict[str, str] = {
+    'SimulationApi': 'SimulationEndpointAPI',  # v1
+    'SimulationEndpointApi': 'SimulationEndpointAPI',  # v2
+    'ImageApi': 'ImageEndpointAPI',  # v1
+    'ImageEndpointApi': 'ImageEndpointAPI',  # v2
+    'ServiceAPI': 'ServiceEndpointAPI',  # v1
+    'ServiceEndpointApi': 'ServiceEndpointAPI',  # v2
+    'MarketplaceDemoApi': 'MarketplaceDemoEndpointAPI',  # v1
+    'MarketplaceDemoEndpointApi': 'MarketplaceDemoEndpointAPI',  # v2
+    'MarketplaceDemoTagApi': 'MarketplaceDemoTagEndpointAPI',  # v1
+    'InterfaceApi': 'InterfaceEndpointAPI',  # v1
+    'InterfaceEndpointApi': 'InterfaceEndpointAPI',  # v2
+    'SimulationInterfaceApi': 'InterfaceEndpointAPI',  # v1
+    'LinkApi': 'LinkEndpointAPI',  # v1
+    'LinkEndpointApi': 'LinkEndpointAPI',  # v2
+    'SSHKeyApi': 'SSHKeyEndpointAPI',  # v1
+    'SimulationNodeApi': 'NodeEndpointAPI',  # v1
+    'NodeEndpointApi': 'NodeEndpointAPI',  # v2
+    'NodeApi': 'NodeEndpointAPI',  # v1
+    'UserConfigAPI': 'UserConfigEndpointAPI',  # v1
+    'UserConfigEndpointApi': 'UserConfigEndpointAPI',  # v2
+    'OrganizationApi': 'OrganizationEndpointAPI',  # v1
+    'ResourceBudget': 'Organization',  # alias
+    'ResourceBudgetEndpointAPI': 'OrganizationEndpointAPI',  # alias
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import lazily exported names on first access and cache them on the module."""
+    if name == '__version__':
+        # Reading the distribution metadata is deferred until the version is needed
+        try:
+            package_version = version('nvidia-air-sdk')
+        except PackageNotFoundError:
+            # package is not installed
+            package_version = 'unknown'
+        globals()['__version__'] = package_version
+        return package_version
+    canonical_name = _BC_ALIASES.get(name, name)
+    try:
+        module_path, attr_name = _DYNAMIC_IMPORTS[canonical_name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    value = getattr(import_module(module_path), attr_name)
+    globals()[canonical_name] = globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_DYNAMIC_IMPORTS, *_BC_ALIASES, '__version__'})
 
-SimulationApi = SimulationEndpointAPI  # v1 BC alias
-SimulationEndpointApi = SimulationEndpointAPI  # v2 BC alias
-ImageApi = ImageEndpointAPI  # v1 BC alias
-ImageEndpointApi = ImageEndpointAPI  # v2 BC alias
-ServiceAPI = ServiceEndpointAPI  # v1 BC alias
-ServiceEndpointApi = ServiceEndpointAPI  # v2 BC alias
-MarketplaceDemoApi = MarketplaceDemoEndpointAPI  # v1 BC alias
-MarketplaceDemoEndpointApi = MarketplaceDemoEndpointAPI  # v2 BC alias
-MarketplaceDemoTagApi = MarketplaceDemoTagEndpointAPI  # v1 BC alias
-InterfaceApi = InterfaceEndpointAPI  # v1 BC alias
-InterfaceEndpointApi = InterfaceEndpointAPI  # v2 BC alias
-SimulationInterfaceApi = InterfaceEndpointAPI  # v1 BC alias
-LinkApi = LinkEndpointAPI  # v1 BC alias
-LinkEndpointApi = LinkEndpointAPI  # v2 BC alias
-SSHKeyApi = SSHKeyEndpointAPI  # v1 BC alias
-SimulationNodeApi = NodeEndpointAPI  # v1 BC alias
-NodeEndpointApi = NodeEndpointAPI  # v2 BC alias
-NodeApi = NodeEndpointAPI  # v1 BC alias
-UserConfigAPI = UserConfigEndpointAPI  # v1 BC alias
-UserConfigEndpointApi = UserConfigEndpointAPI  # v2 BC alias
-OrganizationApi = OrganizationEndpointAPI  # v1 BC alias
 
 # Main class backward compatibility alias
 AirAPI = AirApi  # alias for current tests TODO: remove that after all tests are updated
@@ -40,6 +40,7 @@ from .organization import (
 from .service import ServiceCompatMixin, ServiceEndpointAPICompatMixin
 from .simulation import SimulationCompatMixin, SimulationEndpointAPICompatMixin
 from .user_config import UserConfigEndpointAPICompatMixin
+from .utils import reset_deprecation_warnings
 
 __all__ = [
     'BaseCompatMixin',
@@ -68,4 +69,5 @@ __all__ = [
     'OrganizationCompatMixin',
     'OrganizationEndpointAPICompatMixin',
     'deprecated',
+    'reset_deprecation_warnings',
 ]
@@ -6,10 +6,10 @@
 Base backward compatibility mixin for common v1/v2 SDK patterns.
 """
 
-from typing import Any
+from typing import Any, ClassVar
 
 from air_sdk.bc.decorators import deprecated
-from air_sdk.bc.utils import deprecation_warn
+from air_sdk.bc.utils import deprecation_warn, normalize_kwargs
 
 
 class BaseCompatMixin:
@@ -61,9 +61,54 @@ class AirModelCompatMixin:
     Subclasses can define the following class attributes to enable automatic
     field mapping and removal:
     - _FIELD_MAPPINGS: Dict[str, str] - Maps old field names to new ones
-    - _REMOVED_FIELDS: List[str] - Fields that have been removed and should raise errors
+    - _REMOVED_FIELDS: FrozenSet[str] - Fields that have been removed and should raise
+      errors
+    - _READ_ONLY_FIELDS: FrozenSet[str] - Fields that are dropped from kwargs but can
+      still be read (usually declared on the model itself)
+    - _BOOLEAN_DATETIME_FIELDS: Dict[str, str] - Maps old boolean fields to the
+      datetime fields that replaced them
     """
 
+    # Resolved once per class from _REMOVED_FIELDS / _READ_ONLY_FIELDS / _FIELD_MAPPINGS
+    # / _BOOLEAN_DATETIME_FIELDS
+    __bc_removed__: ClassVar[frozenset[str]] = frozenset()
+    __bc_dropped__: ClassVar[frozenset[str]] = frozenset()
+    __bc_mappings__: ClassVar[dict[str, str]] = {}
+    __bc_boolean_datetime__: ClassVar[dict[str, str]] = {}
+    # Every kwarg name that needs rewriting (dropped or renamed)
+    __bc_legacy_keys__: ClassVar[frozenset[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.__bc_removed__ = frozenset(getattr(cls, '_REMOVED_FIELDS', ()))
+        cls.__bc_dropped__ = cls.__bc_removed__.union(
+            getattr(cls, '_READ_ONLY_FIELDS', ())
+        )
+        cls.__bc_mappings__ = getattr(cls, '_FIELD_MAPPINGS', None) or {}
+        cls.__bc_boolean_datetime__ = getattr(cls, '_BOOLEAN_DATETIME_FIELDS', None) or {}
+        cls.__bc_legacy_keys__ = cls.__bc_dropped__.union(
+            cls.__bc_mappings__, cls.__bc_boolean_datetime__
+        )
+
+    @classmethod
+    def _normalize_kwargs(cls, kwargs: dict[str, Any], **options: Any) -> None:
+        """Convert, drop and rename v1/v2 kwargs in-place using this class's field sets.
+
+        Args:
+            kwargs: Dictionary of keyword arguments to modify in-place
+            **options: Passed through to normalize_kwargs() (exclude_fields,
+                map_first)
+        """
+        # Callers already using v3 names skip normalization with one C-level check
+        if kwargs and not kwargs.keys().isdisjoint(cls.__bc_legacy_keys__):
+            normalize_kwargs(
+                kwargs,
+                cls.__bc_dropped__,
+                cls.__bc_mappings__,
+                boolean_datetime_fields=cls.__bc_boolean_datetime__,
+                **options,
+            )
+
     def _check_and_map_field(self, name: str) -> str:
         """Check if field is removed or needs mapping, return mapped name.
 
@@ -76,18 +121,18 @@ class AirModelCompatMixin:
         Raises:
             AttributeError: If the field has been removed
         """
+        cls = type(self)
+
         # Check for removed fields - raise AttributeError
-        removed_fields = getattr(self.__class__, '_REMOVED_FIELDS', [])
-        if name in removed_fields:
+        if name in cls.__bc_removed__:
             raise AttributeError(
                 f"The attribute '{name}' is no longer supported in the "
                 f'current air-api version.'
             )
 
         # Field name mappings - warn and map to new name
-        field_mappings = getattr(self.__class__, '_FIELD_MAPPINGS', {})
-        if name in field_mappings:
-            new_name: str = field_mappings[name]
+        new_name = cls.__bc_mappings__.get(name)
+        if new_name is not None:
             deprecation_warn(
                 f"The attribute '{name}' has been renamed to '{new_name}' "
                 f'in the current air-api version. '
@@ -107,7 +152,8 @@ class AirModelCompatMixin:
 
         Subclasses define _REMOVED_FIELDS and _FIELD_MAPPINGS as class attributes.
         """
-        name = self._check_and_map_field(name)
+        if not name.startswith('_'):
+            name = self._check_and_map_field(name)
         return super().__getattribute__(name)
 
     def __setattr__(self, name: str, value: Any) -> None:
@@ -119,6 +165,8 @@ class AirModelCompatMixin:
         3. Calls super().__setattr__() to complete the attribute assignment
 
         Subclasses define _REMOVED_FIELDS and _FIELD_MAPPINGS as class attributes.
+        Private names are never remapped and skip the check.
         """
-        name = self._check_and_map_field(name)
+        if not name.startswith('_'):
+            name = self._check_and_map_field(name)
         super().__setattr__(name, value)
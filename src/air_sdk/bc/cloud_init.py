@@ -4,10 +4,13 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from http import HTTPStatus
 from typing import TYPE_CHECKING, Any
 
+from air_sdk import const
 from air_sdk.air_model import AirModel, BaseEndpointAPI, PrimaryKey
 from air_sdk.bc.base import AirModelCompatMixin
 from air_sdk.types import NodeAssignmentDataV2, NodeAssignmentDataV3, UserConfigType
@@ -64,11 +67,14 @@ class CloudInit(AirModelCompatMixin, AirModel):
         """v2 compatibility: primary key value."""
         # Access via the mapped field name
         node_value = self.__getattribute__('node')
-        if hasattr(node_value, '__pk__'):
-            return str(getattr(node_value, '__pk__'))
-        if hasattr(node_value, 'id'):
-            return str(getattr(node_value, 'id'))
-        return '' if node_value is None else str(node_value)
+        try:
+            return str(node_value.__pk__)
+        except AttributeError:
+            pass
+        try:
+            return str(node_value.id)
+        except AttributeError:
+            return '' if node_value is None else str(node_value)
 
     def full_update(
         self,
@@ -108,8 +114,7 @@ class CloudInitEndpointAPI(BaseEndpointAPI[CloudInit]):
         Raises:
             ValueError: If simulation cannot be determined from node
         """
-        from air_sdk.endpoints import Node
-
+        self._resolve_forward_refs()
         if isinstance(node, Node):
             resolved_node = node
         else:
@@ -120,47 +125,57 @@ class CloudInitEndpointAPI(BaseEndpointAPI[CloudInit]):
         self, assignment: NodeAssignmentDataV2
     ) -> NodeAssignmentDataV3:
         """Convert a single v2 assignment to v3 format."""
-        # Extract node ID
-        simulation_node = assignment.get('simulation_node')
+        # Copy the assignment once and swap the node key in place
+        v3_assignment = dict(assignment)
+        simulation_node = v3_assignment.pop('simulation_node', None)
         if simulation_node is None:
             raise ValueError('simulation_node field is required in v2 format')
-
-        # Create a new assignment with the node ID and the remaining fields
-        v3_assignment: NodeAssignmentDataV3 = {
-            **{
-                key: value  # type: ignore[typeddict-item]
-                for key, value in assignment.items()
-                if key != 'simulation_node'
-            },
-            'node': simulation_node,
-        }
-        return v3_assignment
+        v3_assignment['node'] = simulation_node
+        return v3_assignment  # type: ignore[return-value]
 
     def _group_assignments_by_simulation(
-        self, assignments: list[NodeAssignmentDataV3]
+        self, assignments: Iterable[NodeAssignmentDataV3]
     ) -> dict[str, list[NodeAssignmentDataV3]]:
         """Group assignments by their simulation ID.
 
-        Fetches each node to determine its simulation and groups accordingly.
+        Assignments are bucketed by node in a single pass, then each distinct node is
+        fetched once to determine its simulation. The node lookups are independent,
+        so they run concurrently.
         """
-        assignments_by_sim: dict[str, list[NodeAssignmentDataV3]] = dict()
-
+        # Models are unhashable, so bucket by node ID and keep the first node object
+        # seen for each ID to resolve its simulation from
+        nodes: dict[str, Node | PrimaryKey] = {}
+        assignments_by_node: defaultdict[str, list[NodeAssignmentDataV3]]
+        assignments_by_node = defaultdict(list)
         for assignment in assignments:
-            node_id = assignment['node']
-            simulation = self._get_simulation_from_node(node_id)
+            node = assignment['node']
+            node_id = str(getattr(node, 'id', node))
+            nodes.setdefault(node_id, node)
+            assignments_by_node[node_id].append(assignment)
+
+        if len(nodes) > 1:
+            max_workers = min(len(nodes), const.MAX_NODE_LOOKUP_WORKERS)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                simulations = list(
+                    executor.map(self._get_simulation_from_node, nodes.values())
+                )
+        else:
+            simulations = [self._get_simulation_from_node(n) for n in nodes.values()]
+
+        assignments_by_sim: defaultdict[str, list[NodeAssignmentDataV3]] = defaultdict(
+            list
+        )
 
+        for node_id, simulation in zip(nodes, simulations):
             # Extract the ID from the Simulation object or UUID
-            if hasattr(simulation, 'id'):
-                simulation_id = str(simulation.id)
-            else:
-                simulation_id = str(simulation)
+            simulation_id = str(getattr(simulation, 'id', simulation))
 
-            assignments_by_sim.setdefault(simulation_id, list()).append(assignment)
+            assignments_by_sim[simulation_id].extend(assignments_by_node[node_id])
 
         return assignments_by_sim
 
     def _bulk_assign_across_simulations(
-        self, assignments: list[NodeAssignmentDataV3]
+        self, assignments: Iterable[NodeAssignmentDataV3]
     ) -> None:
         """Bulk assign when no simulation context - route to simulation-specific APIs."""
         assignments_by_sim = self._group_assignments_by_simulation(assignments)
@@ -185,6 +200,17 @@ class CloudInitEndpointAPI(BaseEndpointAPI[CloudInit]):
 
             globals()['UserConfig'] = UserConfig
 
+    def _fetch_node_detail(self, node_id: str) -> dict[str, Any]:
+        """Fetch the raw node detail payload, which embeds its cloud-init assignment."""
+        node_response = self.__api__.client.get(
+            join_urls(self.__api__.nodes.url, node_id)
+        )
+        raise_if_invalid_response(
+            node_response, status_code=HTTPStatus.OK, data_type=None
+        )
+        node_detail: dict[str, Any] = node_response.json()
+        return node_detail
+
     def get(self, pk: str, **params: Any) -> CloudInit:
         """Get cloud-init assignment by node ID (v2 compatibility).
 
@@ -193,25 +219,26 @@ class CloudInitEndpointAPI(BaseEndpointAPI[CloudInit]):
         """
         self._resolve_forward_refs()
         node_id = str(pk)
-        node_response = self.__api__.client.get(
-            join_urls(self.__api__.nodes.url, node_id)
-        )
-        raise_if_invalid_response(
-            node_response, status_code=HTTPStatus.OK, data_type=None
-        )
-        cloud_init = self.load_model(
-            node_response.json()['cloud_init'] | {'node': node_id}
-        )
+        node_detail = self._fetch_node_detail(node_id)
+        cloud_init = self.load_model(node_detail['cloud_init'] | {'node': node_id})
         return cloud_init
 
-    def patch(self, pk: PrimaryKey, **kwargs: Any) -> Any:
+    def patch(self, pk: Node | PrimaryKey, **kwargs: Any) -> Any:
         """Update cloud-init assignment by node ID (v2 compatibility).
 
         In v2 API, patch() took a node ID and updated its cloud-init assignment.
-        This is maintained for backwards compatibility.
+        This is maintained for backwards compatibility. A `Node` instance may also
+        be passed, in which case its simulation is used without refetching it.
         """
-        node_id = str(pk)
-        node = self.__api__.nodes.get(node_id)
+        self._resolve_forward_refs()
+        simulation: Simulation | PrimaryKey
+        if isinstance(pk, Node):
+            node_id = str(pk.id)
+            simulation = pk.simulation
+        else:
+            node_id = str(pk)
+            # Only the simulation ID is needed, so the raw node payload is enough
+            simulation = self._fetch_node_detail(node_id)['simulation']
 
         # Extract assignment keys present in kwargs
         # Use bulk_assign to update
@@ -221,7 +248,9 @@ class CloudInitEndpointAPI(BaseEndpointAPI[CloudInit]):
             'node': node_id,
         }
         assignments: list[NodeAssignmentDataV3] = [assignment]
-        node.simulation.node_bulk_assign(nodes=assignments)
+        self.__api__.simulations.node_bulk_assign(
+            simulation=simulation, nodes=assignments
+        )
 
         # Call an explicit GET on the assignment so the node would be
         # refetched and the response edge cases handled
@@ -234,7 +263,7 @@ class CloudInitEndpointAPI(BaseEndpointAPI[CloudInit]):
 
         This is a v2 API compatibility layer around the v3 node assignment API.
         """
-        v3_assignments = [
+        # Conversion is streamed into the grouping pass so the input is walked once
+        self._bulk_assign_across_simulations(
             self._convert_v2_to_v3_assignment(assignment) for assignment in assignments
-        ]
-        self._bulk_assign_across_simulations(v3_assignments)
+        )
@@ -9,7 +9,7 @@ Decorators for backward compatibility layer.
 from functools import wraps
 from typing import Any, Callable, TypeVar, cast
 
-from air_sdk.bc.utils import deprecation_warn
+from air_sdk.bc.utils import deprecation_warn_once
 
 F = TypeVar('F', bound=Callable[..., Any])
 
@@ -21,7 +21,9 @@ def deprecated(message: str) -> Callable[[F], F]:
         message: The deprecation message to display to users
 
     Returns:
-        Decorated function that emits a DeprecationWarning when called
+        Decorated function that emits a DeprecationWarning the first time a call
+        gets past the warning filters; later calls go straight to the wrapped
+        function
 
     Example:
         @deprecated("Use new_method() instead")
@@ -30,9 +32,11 @@ def deprecated(message: str) -> Callable[[F], F]:
     """
 
     def decorator(func: F) -> F:
+        warn_key = f'{func.__module__}.{func.__qualname__}'
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            deprecation_warn(message)
+            deprecation_warn_once(warn_key, message)
             return func(*args, **kwargs)
 
         return cast(F, wrapper)
@@ -11,7 +11,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Iterator
 
 from air_sdk.bc.base import AirModelCompatMixin
-from air_sdk.bc.utils import drop_removed_fields, map_field_names
 
 if TYPE_CHECKING:
     from air_sdk.endpoints.images import Image
@@ -34,20 +33,22 @@ class ImageCompatMixin(AirModelCompatMixin):
     }
 
     # Fields and filters that were removed in v3
-    _REMOVED_FIELDS = [
-        'archived',
-        'bios',
-        'bus',
-        'console_support',
-        'features',
-        'organization',
-        'simx',
-        'uploader',
-        'can_edit',
-        'organization_name',
-        'uploader_username',
-        'contact',
-    ]
+    _REMOVED_FIELDS = frozenset(
+        {
+            'archived',
+            'bios',
+            'bus',
+            'console_support',
+            'features',
+            'organization',
+            'simx',
+            'uploader',
+            'can_edit',
+            'organization_name',
+            'uploader_username',
+            'contact',
+        }
+    )
 
     def update(self, *args: Any, **kwargs: Any) -> None:
         """Update method with v1/v2 field name compatibility for Images.
@@ -61,8 +62,7 @@ class ImageCompatMixin(AirModelCompatMixin):
             This method overrides the parent update() to provide field mapping.
         """
         # Clean up kwargs for v3 compatibility
-        drop_removed_fields(kwargs, self._REMOVED_FIELDS)
-        map_field_names(kwargs, self._FIELD_MAPPINGS)
+        self._normalize_kwargs(kwargs)
 
         # Call the parent update() method
         super().update(*args, **kwargs)  # type: ignore[misc]
@@ -70,12 +70,14 @@ class ImageCompatMixin(AirModelCompatMixin):
     def upload(self, *args: Any, **kwargs: Any) -> Image:
         """Upload method with v1/v2 field name compatibility for Images."""
         # Field mapping and cleanup happens in ImageEndpointAPICompatMixin.upload()
-        return self.model_api.upload(image=self, *args, **kwargs)  # type: ignore[no-any-return]
+        kwargs['image'] = self
+        return self.model_api.upload(*args, **kwargs)  # type: ignore[no-any-return]
 
     def publish(self, *args: Any, **kwargs: Any) -> Image:
         """Publish method with v1/v2 field name compatibility for Images."""
         # Clean up happens in ImageEndpointAPICompatMixin.publish()
-        return self.model_api.publish(image=self, *args, **kwargs)  # type: ignore[no-any-return]
+        kwargs['image'] = self
+        return self.model_api.publish(*args, **kwargs)  # type: ignore[no-any-return]
 
 
 class ImageEndpointAPICompatMixin:
@@ -85,7 +87,7 @@ class ImageEndpointAPICompatMixin:
     where v1/v2 used different parameter or field names than v3.
     """
 
-    def create(self, *args: Any, **kwargs: Any) -> Image:
+    def create(self, **kwargs: Any) -> Image:
         """Create method with v1/v2 field name compatibility for Images.
 
         Handles:
@@ -93,13 +95,12 @@ class ImageEndpointAPICompatMixin:
         - Removed fields (see ImageCompatMixin._REMOVED_FIELDS)
         """
         # Clean up kwargs for v3 (do this once at the start)
-        drop_removed_fields(kwargs, ImageCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, ImageCompatMixin._FIELD_MAPPINGS)
+        ImageCompatMixin._normalize_kwargs(kwargs)
 
         # Call the v3 create() method
-        return self.create_v3(*args, **kwargs)  # type: ignore[attr-defined, no-any-return]
+        return self.create_v3(**kwargs)  # type: ignore[attr-defined, no-any-return]
 
-    def list(self, *args: Any, **kwargs: Any) -> Iterator[Image]:
+    def list(self, **kwargs: Any) -> Iterator[Image]:
         """List method with v1/v2 field name compatibility for Images.
 
         Handles:
@@ -107,10 +108,9 @@ class ImageEndpointAPICompatMixin:
         - Removed filters (see ImageCompatMixin._REMOVED_FIELDS)
         """
         # Drop removed fields (includes both body fields and filters)
-        drop_removed_fields(kwargs, ImageCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, ImageCompatMixin._FIELD_MAPPINGS)
+        ImageCompatMixin._normalize_kwargs(kwargs)
 
-        return super().list(*args, **kwargs)  # type: ignore[no-any-return,misc]
+        return super().list(**kwargs)  # type: ignore[no-any-return,misc]
 
     def patch(self, *args: Any, **kwargs: Any) -> Image:
         """Patch method with v1/v2 field name compatibility for Images.
@@ -119,8 +119,7 @@ class ImageEndpointAPICompatMixin:
         - Field name mapping (see ImageCompatMixin._FIELD_MAPPINGS)
         - Removed fields (see ImageCompatMixin._REMOVED_FIELDS)
         """
-        drop_removed_fields(kwargs, ImageCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, ImageCompatMixin._FIELD_MAPPINGS)
+        ImageCompatMixin._normalize_kwargs(kwargs)
         return super().patch(*args, **kwargs)  # type: ignore[no-any-return,misc]
 
     def upload(self, *args: Any, **kwargs: Any) -> Image:
@@ -131,8 +130,7 @@ class ImageEndpointAPICompatMixin:
         - Removed fields (see ImageCompatMixin._REMOVED_FIELDS)
         """
         # Clean up kwargs for v3 compatibility
-        drop_removed_fields(kwargs, ImageCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, ImageCompatMixin._FIELD_MAPPINGS)
+        ImageCompatMixin._normalize_kwargs(kwargs)
 
         return self.upload_v3(*args, **kwargs)  # type: ignore[attr-defined, no-any-return]
 
@@ -143,8 +141,7 @@ class ImageEndpointAPICompatMixin:
         - Removed fields (see ImageCompatMixin._REMOVED_FIELDS)
         """
         # Clean up kwargs for v3 compatibility
-        drop_removed_fields(kwargs, ImageCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, ImageCompatMixin._FIELD_MAPPINGS)
+        ImageCompatMixin._normalize_kwargs(kwargs)
 
         # Call the parent publish() method
         return self.publish_v3(*args, **kwargs)  # type: ignore[attr-defined, no-any-return]
@@ -8,10 +8,10 @@ Interface-specific backward compatibility for v1/v2 SDK.
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
 from air_sdk.bc.base import AirModelCompatMixin
-from air_sdk.bc.utils import drop_removed_fields
 
 if TYPE_CHECKING:
     from air_sdk.endpoints.interfaces import Interface
@@ -29,21 +29,23 @@ class InterfaceCompatMixin(AirModelCompatMixin):
     """
 
     # Fields that were removed in v3
-    _REMOVED_FIELDS = [
-        'link_up',
-        'internal_ipv4',
-        'full_ipv6',
-        'prefix_ipv6',
-        'port_number',
-        'simulation',
-        'preserve_mac',
-        'link',
-        'url',
-        'index',
-        'link_id',
-        'original',
-        'services',
-    ]
+    _REMOVED_FIELDS = frozenset(
+        {
+            'link_up',
+            'internal_ipv4',
+            'full_ipv6',
+            'prefix_ipv6',
+            'port_number',
+            'simulation',
+            'preserve_mac',
+            'link',
+            'url',
+            'index',
+            'link_id',
+            'original',
+            'services',
+        }
+    )
 
     def update(self, *args: Any, **kwargs: Any) -> None:
         """Update method with field name compatibility for Interfaces.
@@ -52,12 +54,18 @@ class InterfaceCompatMixin(AirModelCompatMixin):
         - Fields in _REMOVED_FIELDS
         """
         # Clean up kwargs for v3 compatibility
-        drop_removed_fields(kwargs, self._REMOVED_FIELDS)
+        self._normalize_kwargs(kwargs)
 
         # Call the parent update() method
         super().update(*args, **kwargs)  # type: ignore[misc]
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Invalidate the cached simulation whenever the node is reassigned."""
+        if name == 'node':
+            self.__dict__.pop('simulation', None)
+        super().__setattr__(name, value)
+
+    @cached_property
     def simulation(self) -> Any:
         """v1/v2 BC: Get simulation via interface → node → simulation chain.
 
@@ -65,6 +73,9 @@ class InterfaceCompatMixin(AirModelCompatMixin):
         accessed interface.simulation. In v3, simulation is derived from the
         interface relationship: interface.node → Node.simulation
 
+        The result is cached on the instance and cleared when `node` is set
+        (including during refresh).
+
         Returns:
             Simulation object
 
@@ -85,7 +96,7 @@ class InterfaceEndpointAPICompatMixin:
     def create(self, *args: Any, **kwargs: Any) -> Interface:
         """Create an interface with v1/v2 field name compatibility."""
         # Clean up kwargs for v3 (do this once at the start)
-        drop_removed_fields(kwargs, InterfaceCompatMixin._REMOVED_FIELDS)
+        InterfaceCompatMixin._normalize_kwargs(kwargs)
         return super().create(*args, **kwargs)  # type: ignore[no-any-return, misc]
 
     def list(self, **params: Any) -> IndexableIterator[Interface]:
@@ -96,7 +107,5 @@ class InterfaceEndpointAPICompatMixin:
         - Preserves 'simulation' filter for v3 compatibility
         """
         # Drop removed fields except 'simulation' (used as filter in v3)
-        drop_removed_fields(
-            params, InterfaceCompatMixin._REMOVED_FIELDS, exclude_fields=['simulation']
-        )
+        InterfaceCompatMixin._normalize_kwargs(params, exclude_fields=['simulation'])
         return super().list(**params)  # type: ignore[no-any-return, misc]
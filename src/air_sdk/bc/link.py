@@ -13,7 +13,6 @@ from typing import TYPE_CHECKING, Any
 from air_sdk.air_model import PrimaryKey
 from air_sdk.bc.base import AirModelCompatMixin
 from air_sdk.bc.decorators import deprecated
-from air_sdk.bc.utils import drop_removed_fields, map_field_names
 from air_sdk.utils import validate_payload_types
 
 if TYPE_CHECKING:
@@ -27,10 +26,12 @@ class LinkCompatMixin(AirModelCompatMixin):
     This maintains compatibility with link fields and methods from older SDK versions.
     """
 
-    _REMOVED_FIELDS = [
-        'topology',
-        'ids',
-    ]
+    _REMOVED_FIELDS = frozenset(
+        {
+            'topology',
+            'ids',
+        }
+    )
     _FIELD_MAPPINGS: dict[str, str] = {}
 
     def update(self, **kwargs: Any) -> Any:
@@ -53,8 +54,7 @@ class LinkEndpointAPICompatMixin:
         - Field name mapping (see LinkCompatMixin._FIELD_MAPPINGS)
         - Removed fields (see LinkCompatMixin._REMOVED_FIELDS)
         """
-        drop_removed_fields(kwargs, LinkCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, LinkCompatMixin._FIELD_MAPPINGS)
+        LinkCompatMixin._normalize_kwargs(kwargs)
         return super().create(*args, **kwargs)  # type: ignore[no-any-return, misc]
 
     def list(self, *args: Any, **kwargs: Any) -> Any:
@@ -64,8 +64,7 @@ class LinkEndpointAPICompatMixin:
         - Field name mapping (see LinkCompatMixin._FIELD_MAPPINGS)
         - Removed filters (see LinkCompatMixin._REMOVED_FIELDS)
         """
-        drop_removed_fields(kwargs, LinkCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, LinkCompatMixin._FIELD_MAPPINGS)
+        LinkCompatMixin._normalize_kwargs(kwargs)
         return super().list(*args, **kwargs)  # type: ignore[misc]
 
     @validate_payload_types
@@ -98,8 +97,7 @@ class LinkEndpointAPICompatMixin:
             Use :meth:`create` for each link instead.
         """
         # Drop any removed fields that might have been passed
-        drop_removed_fields(kwargs, LinkCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, LinkCompatMixin._FIELD_MAPPINGS)
+        LinkCompatMixin._normalize_kwargs(kwargs)
 
         # Create links one by one, with rollback on failure
         created_links = []
@@ -167,8 +165,7 @@ class LinkEndpointAPICompatMixin:
             ValueError: If simulation is not provided or links is an empty list
         """
         # Drop any removed fields that might have been passed
-        drop_removed_fields(kwargs, LinkCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, LinkCompatMixin._FIELD_MAPPINGS)
+        LinkCompatMixin._normalize_kwargs(kwargs)
 
         # Get links to delete
         links = kwargs.get('links')
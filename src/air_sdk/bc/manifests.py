@@ -12,7 +12,6 @@ from typing import TYPE_CHECKING, Any, ClassVar, Iterator, Type
 
 from air_sdk.air_model import PrimaryKey
 from air_sdk.bc.base import AirModelCompatMixin, BaseEndpointAPICompatMixin
-from air_sdk.bc.utils import drop_removed_fields, map_field_names
 
 if TYPE_CHECKING:
     from air_sdk.endpoints.manifests import Manifest
@@ -31,9 +30,9 @@ class ManifestCompatMixin(AirModelCompatMixin):
         'organization' is in _FIELD_MAPPINGS for backwards compatibility when
         reading (my_manifest.organization) and when writing: if the user passes
         organization, we map it to org_name then drop org_name (read-only).
-        So create/update/patch: map_field_names first (organization → org_name,
-        warn), then drop_removed_fields so org_name is dropped and a second
-        warning is emitted (read-only). Passing org_name directly is also
+        So create/update/patch: _normalize_kwargs with map_first=True maps first
+        (organization → org_name, warn), then drops org_name and emits a second
+        warning (read-only). Passing org_name directly is also
         dropped and warned via _READ_ONLY_FIELDS.
     """
 
@@ -44,9 +43,7 @@ class ManifestCompatMixin(AirModelCompatMixin):
     }
 
     # Fields that were removed in v3
-    _REMOVED_FIELDS = [
-        'owner',
-    ]
+    _REMOVED_FIELDS = frozenset({'owner'})
 
     def update(self, *args: Any, **kwargs: Any) -> None:
         """Update method with v2 field name compatibility for Manifests.
@@ -59,8 +56,7 @@ class ManifestCompatMixin(AirModelCompatMixin):
         Note:
             This method overrides the parent update() to provide field mapping.
         """
-        map_field_names(kwargs, ManifestCompatMixin._FIELD_MAPPINGS)
-        drop_removed_fields(kwargs, self._REMOVED_FIELDS + self._READ_ONLY_FIELDS)
+        self._normalize_kwargs(kwargs, map_first=True)
 
         # Call the parent update() method
         super().update(*args, **kwargs)  # type: ignore[misc]
@@ -84,11 +80,7 @@ class ManifestEndpointAPICompatMixin(BaseEndpointAPICompatMixin):
         - Removed fields (see ManifestCompatMixin._REMOVED_FIELDS)
         - Read-only fields (see Manifest._READ_ONLY_FIELDS)
         """
-        map_field_names(kwargs, ManifestCompatMixin._FIELD_MAPPINGS)
-        drop_removed_fields(
-            kwargs,
-            ManifestCompatMixin._REMOVED_FIELDS + self.model._READ_ONLY_FIELDS,
-        )
+        self.model._normalize_kwargs(kwargs, map_first=True)
 
         # Call the parent create() method
         return super().create(*args, **kwargs)  # type: ignore[no-any-return,misc]
@@ -101,11 +93,7 @@ class ManifestEndpointAPICompatMixin(BaseEndpointAPICompatMixin):
         - Removed filters (see ManifestCompatMixin._REMOVED_FIELDS)
         - Read-only filters (see Manifest._READ_ONLY_FIELDS)
         """
-        map_field_names(kwargs, ManifestCompatMixin._FIELD_MAPPINGS)
-        drop_removed_fields(
-            kwargs,
-            ManifestCompatMixin._REMOVED_FIELDS + self.model._READ_ONLY_FIELDS,
-        )
+        self.model._normalize_kwargs(kwargs, map_first=True)
 
         return super().list(*args, **kwargs)  # type: ignore[no-any-return,misc]
 
@@ -118,10 +106,6 @@ class ManifestEndpointAPICompatMixin(BaseEndpointAPICompatMixin):
         - Read-only fields (see Manifest._READ_ONLY_FIELDS)
         """
         # Map v2 names first, then drop removed/read-only
-        map_field_names(kwargs, ManifestCompatMixin._FIELD_MAPPINGS)
-        drop_removed_fields(
-            kwargs,
-            ManifestCompatMixin._REMOVED_FIELDS + self.model._READ_ONLY_FIELDS,
-        )
+        self.model._normalize_kwargs(kwargs, map_first=True)
 
         return super().patch(pk, **kwargs)  # type: ignore[no-any-return,misc]
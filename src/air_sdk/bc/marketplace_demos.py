@@ -8,10 +8,10 @@ MarketplaceDemo-specific backward compatibility for v1/v2 SDK.
 
 from __future__ import annotations
 
+from dataclasses import MISSING
 from typing import Any
 
 from air_sdk.bc.base import AirModelCompatMixin
-from air_sdk.bc.utils import map_field_names
 
 
 class MarketplaceDemoCompatMixin(AirModelCompatMixin):
@@ -32,7 +32,7 @@ class MarketplaceDemoCompatMixin(AirModelCompatMixin):
     }
 
     # Fields and filters that were removed in v3
-    _REMOVED_FIELDS: list[str] = []
+    _REMOVED_FIELDS: frozenset[str] = frozenset()
 
     def update(self, *args: Any, **kwargs: Any) -> None:
         """Update method with field name compatibility for MarketplaceDemos.
@@ -45,7 +45,7 @@ class MarketplaceDemoCompatMixin(AirModelCompatMixin):
             This method overrides the parent update() to provide field mapping.
         """
         # Map remaining v1/v2 field names to v3 equivalents
-        map_field_names(kwargs, self._FIELD_MAPPINGS)
+        self._normalize_kwargs(kwargs)
         super().update(*args, **kwargs)  # type: ignore[misc]
         return self  # type: ignore[return-value]
 
@@ -59,7 +59,7 @@ class MarketplaceDemoEndpointAPICompatMixin:
 
     def list(self, *args: Any, **kwargs: Any) -> Any:
         """List marketplace demos with v1/v2 filter name compatibility."""
-        map_field_names(kwargs, MarketplaceDemoCompatMixin._FIELD_MAPPINGS)
+        MarketplaceDemoCompatMixin._normalize_kwargs(kwargs)
         return super().list(*args, **kwargs)  # type: ignore[misc]
 
     def create(self, *args: Any, **kwargs: Any) -> Any:
@@ -75,7 +75,8 @@ class MarketplaceDemoEndpointAPICompatMixin:
         """
         # Handle 'snapshot' -> 'simulation' mapping BEFORE general field mapping
         # In v1/v2, 'snapshot' was used; in v3 it's 'simulation'
-        if 'snapshot' in kwargs:
-            kwargs['simulation'] = kwargs.pop('snapshot')
+        snapshot = kwargs.pop('snapshot', MISSING)
+        if snapshot is not MISSING:
+            kwargs['simulation'] = snapshot
 
         return super().create(*args, **kwargs)  # type: ignore[misc]
@@ -7,18 +7,25 @@
 from __future__ import annotations
 
 import json
-from typing import TYPE_CHECKING, Any
+from dataclasses import MISSING
+from typing import TYPE_CHECKING, Any, cast
 
 from air_sdk.bc.base import AirModelCompatMixin
 from air_sdk.bc.decorators import deprecated
-from air_sdk.bc.utils import deprecation_warn, drop_removed_fields, map_field_names
+from air_sdk.bc.utils import deprecation_warn
 from air_sdk.types import NodeAssignmentDataV3
 from air_sdk.utils import raise_if_invalid_response
 
 if TYPE_CHECKING:
-    from air_sdk.bc import CloudInit
+    from air_sdk.bc import CloudInit, CloudInitEndpointAPI
     from air_sdk.endpoints.simulations import Simulation
 
+# v1/v2 'features' keys that carry over into the v3 'advanced' dict
+_FEATURE_KEYS = ('uefi', 'tpm')
+
+# Removed fields that create() keeps long enough to handle the v2 'system' redirect
+_CREATE_KEEP_FIELDS = frozenset({'system'})
+
 
 def _inject_management_fields_into_metadata(data: dict[str, Any]) -> None:
     """Inject management_ip and management_mac into metadata for v1/v2 BC.
@@ -81,12 +88,11 @@ def _map_features_field_to_advanced_field(kwargs: dict[str, Any]) -> None:
 
         # Extract 'uefi' and 'tpm' from features
         # The field name mapping will handle renaming 'features' → 'advanced'
-        if 'uefi' in parsed_features or 'tpm' in parsed_features:
-            kwargs['features'] = {}
-            if 'uefi' in parsed_features:
-                kwargs['features']['uefi'] = parsed_features['uefi']
-            if 'tpm' in parsed_features:
-                kwargs['features']['tpm'] = parsed_features['tpm']
+        extracted_features = {
+            key: parsed_features[key] for key in _FEATURE_KEYS if key in parsed_features
+        }
+        if extracted_features:
+            kwargs['features'] = extracted_features
         else:
             kwargs.pop('features', None)
     except (json.JSONDecodeError, TypeError) as e:
@@ -121,23 +127,25 @@ class NodeCompatMixin(AirModelCompatMixin):
     }
 
     # Fields that were removed in v3
-    _REMOVED_FIELDS = [
-        'boot_group',
-        'console_password',
-        'console_port',
-        'console_url',
-        'console_username',
-        'interfaces',
-        'last_worker',
-        'original',
-        'serial_port',
-        'simx_ipv4',
-        'system',
-        'topology',
-        'version',
-        'worker',
-        'emulated',
-    ]
+    _REMOVED_FIELDS = frozenset(
+        {
+            'boot_group',
+            'console_password',
+            'console_port',
+            'console_url',
+            'console_username',
+            'interfaces',
+            'last_worker',
+            'original',
+            'serial_port',
+            'simx_ipv4',
+            'system',
+            'topology',
+            'version',
+            'worker',
+            'emulated',
+        }
+    )
 
     def update(self, *args: Any, **kwargs: Any) -> None:
         """Update method with field name compatibility for Nodes.
@@ -150,10 +158,10 @@ class NodeCompatMixin(AirModelCompatMixin):
             This method overrides the parent update() to provide field mapping.
             Removed fields are silently dropped to maintain compatibility.
         """
-        # Clean up kwargs for v3 compatibility
-        drop_removed_fields(kwargs, self._REMOVED_FIELDS)
+        # Clean up kwargs for v3 compatibility: convert features content, then
+        # drop removed fields and map field names in one pass
         _map_features_field_to_advanced_field(kwargs)
-        map_field_names(kwargs, self._FIELD_MAPPINGS)
+        self._normalize_kwargs(kwargs)
 
         # Call the parent update() method
         super().update(*args, **kwargs)  # type: ignore[misc]
@@ -298,9 +306,9 @@ class NodeCompatMixin(AirModelCompatMixin):
         Returns:
             CloudInit object for this node.
         """
-        from air_sdk.bc.cloud_init import CloudInitEndpointAPI
-
-        return CloudInitEndpointAPI(self.__api__).get(self.id)
+        # Reuse the endpoint cached on the API client instead of building one per access
+        endpoint: CloudInitEndpointAPI = self.__api__._cloud_init_endpoint
+        return endpoint.get(self.id)
 
     def get_cloud_init_assignment(self) -> dict[str, Any]:
         """Returns cloud-init assignment for the node (V1 compatibility).
@@ -351,18 +359,16 @@ class NodeCompatMixin(AirModelCompatMixin):
             # Identical to node.get_cloud_init_assignment()
             >>> node.set_cloud_init_assignment({})
         """
-        # Build assignment payload
         # If no assignment, just return current state
-        assignment: NodeAssignmentDataV3 = {**script_mapping}  # type: ignore[typeddict-item]
-        if not assignment:
+        if not script_mapping:
             return self.get_cloud_init_assignment()
 
-        # Use bulk_assign with single assignment
-        assignment['node'] = self.id
+        # Build assignment payload and use bulk_assign with single assignment
+        assignment = cast(NodeAssignmentDataV3, script_mapping | {'node': self.id})
         assignments: list[NodeAssignmentDataV3] = [assignment]
 
-        # Determine simulation
-        simulation: Simulation | None = getattr(self, 'simulation', None)
+        # Determine simulation (a required field on Node, so always set)
+        simulation: Simulation | None = self.simulation
         if not simulation:
             raise ValueError(
                 f'Could not determine simulation for node {self.id}. '
@@ -429,21 +435,20 @@ class NodeEndpointAPICompatMixin:
         # dropping removed fields (since 'system' is in removed fields list)
         # Map content first (features->advanced), then field names
         _map_features_field_to_advanced_field(kwargs)
-        map_field_names(kwargs, NodeCompatMixin._FIELD_MAPPINGS)
-        drop_removed_fields(
-            kwargs, NodeCompatMixin._REMOVED_FIELDS, exclude_fields=['system']
+        NodeCompatMixin._normalize_kwargs(
+            kwargs, exclude_fields=_CREATE_KEEP_FIELDS, map_first=True
         )
 
-        if 'system' in kwargs:
-            system = kwargs.pop('system')
-            if system is not None:
-                # Warn about deprecated usage
-                deprecation_warn(
-                    "Passing 'system' to create() is deprecated. "
-                    'Use create_from_system_node() instead.'
-                )
-                # Redirect to create_from_system_node endpoint
-                return self.create_from_system_node(system_node=system, *args, **kwargs)  # type: ignore[attr-defined]
+        # A 'system' of None is dropped just like an absent one
+        system = kwargs.pop('system', None)
+        if system is not None:
+            # Warn about deprecated usage
+            deprecation_warn(
+                "Passing 'system' to create() is deprecated. "
+                'Use create_from_system_node() instead.'
+            )
+            # Redirect to create_from_system_node endpoint
+            return self.create_from_system_node(system_node=system, *args, **kwargs)  # type: ignore[attr-defined]
 
         return super().create(*args, **kwargs)  # type: ignore[misc]
 
@@ -461,8 +466,7 @@ class NodeEndpointAPICompatMixin:
             Paginated list of Node objects.
         """
         # Clean up kwargs for v3 compatibility
-        map_field_names(kwargs, NodeCompatMixin._FIELD_MAPPINGS)
-        drop_removed_fields(kwargs, NodeCompatMixin._REMOVED_FIELDS)
+        NodeCompatMixin._normalize_kwargs(kwargs, map_first=True)
         return super().list(*args, **kwargs)  # type: ignore[misc]
 
     def get(self, *args: Any, **kwargs: Any) -> Any:
@@ -485,13 +489,12 @@ class NodeEndpointAPICompatMixin:
             The simulation_id parameter is deprecated
             and will be removed in a future version.
         """
-        if 'simulation_id' in kwargs:
+        # Remove it entirely - don't pass it to v3 API
+        if kwargs.pop('simulation_id', MISSING) is not MISSING:
             deprecation_warn(
                 "Passing 'simulation_id' to get() is unnecessary. "
                 'Node IDs are globally unique - just use get(node_id). '
             )
-            # Remove it entirely - don't pass it to v3 API
-            kwargs.pop('simulation_id')
 
         return super().get(*args, **kwargs)  # type: ignore[misc]
 
@@ -503,9 +506,8 @@ class NodeEndpointAPICompatMixin:
         - features → advanced
         """
         # Clean up kwargs for v3 compatibility
-        drop_removed_fields(kwargs, NodeCompatMixin._REMOVED_FIELDS)
         _map_features_field_to_advanced_field(kwargs)
-        map_field_names(kwargs, NodeCompatMixin._FIELD_MAPPINGS)
+        NodeCompatMixin._normalize_kwargs(kwargs)
 
         return super().patch(*args, **kwargs)  # type: ignore[misc]
 
@@ -563,8 +565,7 @@ class NodeEndpointAPICompatMixin:
         if 'simulation_node_id' in kwargs:
             kwargs['node'] = kwargs.pop('simulation_node_id')
         _map_features_field_to_advanced_field(kwargs)
-        map_field_names(kwargs, NodeCompatMixin._FIELD_MAPPINGS)
-        drop_removed_fields(kwargs, NodeCompatMixin._REMOVED_FIELDS)
+        NodeCompatMixin._normalize_kwargs(kwargs, map_first=True)
         self.update(*args, **kwargs)  # type: ignore[attr-defined]
 
     @deprecated('get_simulation_nodes() is deprecated, use airApi.nodes.list() instead.')
@@ -7,10 +7,10 @@ Instruction-specific backward compatibility for v2 SDK.
 """
 
 import json
-from typing import Any
+from typing import Any, Callable
 
 from air_sdk.bc.base import AirModelCompatMixin
-from air_sdk.bc.utils import deprecation_warn, drop_removed_fields, map_field_names
+from air_sdk.bc.utils import deprecation_warn, deprecation_warn_once
 
 # Executor type constants
 EXECUTOR_SHELL = 'shell'
@@ -29,6 +29,65 @@ DEPRECATION_MESSAGES = {
 }
 
 
+def _shell_data_to_dict(data_str: str) -> dict[str, Any]:
+    """Convert V2 'shell' executor data to V3's {'commands': [...]}."""
+    return {'commands': [data_str]}
+
+
+def _init_data_to_dict(data_str: str) -> dict[str, Any]:
+    """Convert V2 'init' executor data to V3's {'hostname': ...}."""
+    return {'hostname': data_str}
+
+
+def _file_data_to_dict(data_str: str) -> dict[str, Any]:
+    """Convert V2 'file' executor data (JSON string) to V3's files/post_commands dict."""
+    try:
+        # Try to parse as JSON (V2 format with file paths and content)
+        v2_data = json.loads(data_str)
+
+        # Extract post_cmd if present
+        post_cmd = v2_data.pop('post_cmd', None)
+
+        # Validate exactly one file is included
+        if len(v2_data) != 1:
+            raise ValueError(
+                "Invalid 'file' executor data: must include exactly one file. "
+                "V2 format: {'<file_path>': '<content>'} or "
+                "{'<file_path>': '<content>', 'post_cmd': '<command>'}"
+            )
+
+        # Convert remaining entry to files list
+        files = [{'path': path, 'content': content} for path, content in v2_data.items()]
+
+        # Build V3 format
+        v3_data: dict[str, Any] = {'files': files}
+        if post_cmd:
+            if isinstance(post_cmd, str):
+                v3_data['post_commands'] = [post_cmd]
+            elif isinstance(post_cmd, list):
+                v3_data['post_commands'] = post_cmd
+            else:
+                raise ValueError(
+                    'Invalid `post_cmd` type: must be a string or list of strings'
+                )
+
+        return v3_data
+    except (json.JSONDecodeError, AttributeError) as e:
+        raise ValueError(
+            "Invalid 'file' executor data: must be valid JSON. "
+            "V2 format: {'<file_path>': '<content>'} or "
+            "{'<file_path>': '<content>', 'post_cmd': '<command>'}"
+        ) from e
+
+
+# Converters for V2 string 'data', keyed by executor type
+_DATA_CONVERTERS: dict[str, Callable[[str], dict[str, Any]]] = {
+    EXECUTOR_SHELL: _shell_data_to_dict,
+    EXECUTOR_INIT: _init_data_to_dict,
+    EXECUTOR_FILE: _file_data_to_dict,
+}
+
+
 def _convert_data_field_to_dict(kwargs: dict[str, Any]) -> None:
     """Convert V2's string 'data' parameter to V3's dict format based on executor type.
 
@@ -38,64 +97,22 @@ def _convert_data_field_to_dict(kwargs: dict[str, Any]) -> None:
     - 'file': {'files': [{'path': str, 'content': str}, ...], 'post_commands': [str, ...]}
     - 'init': {'hostname': str}
     """
-    data_str = kwargs['data']
+    # If executor is not specified or unknown, we cannot convert - let it fail naturally
     executor = kwargs.get('executor')
-
-    # If executor is not specified, we cannot convert - let it fail naturally
-    if executor is None:
+    if not isinstance(executor, str):
+        return
+    converter = _DATA_CONVERTERS.get(executor)
+    if converter is None:
         return
 
-    # Issue single deprecation warning with dynamic message
-    if executor in VALID_EXECUTORS:
-        deprecation_warn(
-            f"Passing 'data' as a string for '{executor}' executor is deprecated. "
-            f'Use a dict instead: {DEPRECATION_MESSAGES[executor]}'
-        )
-
-    if executor == EXECUTOR_SHELL:
-        kwargs['data'] = {'commands': [data_str]}
-    elif executor == EXECUTOR_INIT:
-        kwargs['data'] = {'hostname': data_str}
-    elif executor == EXECUTOR_FILE:
-        try:
-            # Try to parse as JSON (V2 format with file paths and content)
-            v2_data = json.loads(data_str)
-
-            # Extract post_cmd if present
-            post_cmd = v2_data.pop('post_cmd', None)
-
-            # Validate exactly one file is included
-            if len(v2_data) != 1:
-                raise ValueError(
-                    "Invalid 'file' executor data: must include exactly one file. "
-                    "V2 format: {'<file_path>': '<content>'} or "
-                    "{'<file_path>': '<content>', 'post_cmd': '<command>'}"
-                )
+    # Warn once per executor type, not on every call
+    deprecation_warn_once(
+        f'{__name__}.data:{executor}',
+        f"Passing 'data' as a string for '{executor}' executor is deprecated. "
+        f'Use a dict instead: {DEPRECATION_MESSAGES[executor]}',
+    )
 
-            # Convert remaining entry to files list
-            files = [
-                {'path': path, 'content': content} for path, content in v2_data.items()
-            ]
-
-            # Build V3 format
-            v3_data: dict[str, Any] = {'files': files}
-            if post_cmd:
-                if isinstance(post_cmd, str):
-                    v3_data['post_commands'] = [post_cmd]
-                elif isinstance(post_cmd, list):
-                    v3_data['post_commands'] = post_cmd
-                else:
-                    raise ValueError(
-                        'Invalid `post_cmd` type: must be a string or list of strings'
-                    )
-
-            kwargs['data'] = v3_data
-        except (json.JSONDecodeError, AttributeError) as e:
-            raise ValueError(
-                "Invalid 'file' executor data: must be valid JSON. "
-                "V2 format: {'<file_path>': '<content>'} or "
-                "{'<file_path>': '<content>', 'post_cmd': '<command>'}"
-            ) from e
+    kwargs['data'] = converter(kwargs['data'])
 
 
 class NodeInstructionCompatMixin(AirModelCompatMixin):
@@ -113,13 +130,12 @@ class NodeInstructionCompatMixin(AirModelCompatMixin):
     }
 
     # Fields and filters that were removed in v3
-    _REMOVED_FIELDS = ['monitor']
+    _REMOVED_FIELDS = frozenset({'monitor'})
 
     def update(self, *args: Any, **kwargs: Any) -> None:
         """Update method with field name compatibility for Instructions."""
         # Clean up kwargs for v3 compatibility
-        drop_removed_fields(kwargs, self._REMOVED_FIELDS)
-        map_field_names(kwargs, self._FIELD_MAPPINGS)
+        self._normalize_kwargs(kwargs)
 
         # handle the case where the user tries to update the data of the instruction
         if 'data' in kwargs:
@@ -148,8 +164,7 @@ class NodeInstructionEndpointAPICompatMixin:
         - pk: str → node: str (node ID)
         - Drops monitor fields
         """
-        drop_removed_fields(kwargs, NodeInstructionCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, NodeInstructionCompatMixin._FIELD_MAPPINGS)
+        NodeInstructionCompatMixin._normalize_kwargs(kwargs)
 
         # handle the case where the user tries to create the instruction with the pk field
         if 'pk' in kwargs:
@@ -166,8 +181,7 @@ class NodeInstructionEndpointAPICompatMixin:
         Handles:
         - Drops monitor field
         """
-        drop_removed_fields(kwargs, NodeInstructionCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, NodeInstructionCompatMixin._FIELD_MAPPINGS)
+        NodeInstructionCompatMixin._normalize_kwargs(kwargs)
 
         return super().list(*args, **kwargs)  # type: ignore[misc]
 
@@ -177,8 +191,7 @@ class NodeInstructionEndpointAPICompatMixin:
         Handles:
         - Drops monitor field
         """
-        drop_removed_fields(kwargs, NodeInstructionCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, NodeInstructionCompatMixin._FIELD_MAPPINGS)
+        NodeInstructionCompatMixin._normalize_kwargs(kwargs)
 
         # handle the case where the user tries to update the data of the instruction
         if 'data' in kwargs:
@@ -11,7 +11,6 @@ from __future__ import annotations
 from typing import Any, Iterator
 
 from air_sdk.bc.base import AirModelCompatMixin
-from air_sdk.bc.utils import drop_removed_fields, map_field_names
 
 
 class OrganizationCompatMixin(AirModelCompatMixin):
@@ -37,18 +36,20 @@ class OrganizationCompatMixin(AirModelCompatMixin):
     }
 
     # Fields that were removed in v3
-    _REMOVED_FIELDS = [
-        'member_count',
-        'resource_budget',
-        'cpu_used',
-        'memory_used',
-        'storage_used',
-        'simulations',
-        'simulations_used',
-        'image_uploads',
-        'image_uploads_used',
-        'userconfigs_used',
-    ]
+    _REMOVED_FIELDS = frozenset(
+        {
+            'member_count',
+            'resource_budget',
+            'cpu_used',
+            'memory_used',
+            'storage_used',
+            'simulations',
+            'simulations_used',
+            'image_uploads',
+            'image_uploads_used',
+            'userconfigs_used',
+        }
+    )
 
 
 class OrganizationEndpointAPICompatMixin:
@@ -65,9 +66,8 @@ class OrganizationEndpointAPICompatMixin:
         - Field name mapping for filters (see OrganizationCompatMixin._FIELD_MAPPINGS)
         - Removed filters (see OrganizationCompatMixin._REMOVED_FIELDS)
         """
-        # Drop removed fields (includes both body fields and filters)
-        drop_removed_fields(kwargs, OrganizationCompatMixin._REMOVED_FIELDS)
-        # Map old field names to new ones for filtering
-        map_field_names(kwargs, OrganizationCompatMixin._FIELD_MAPPINGS)
+        # Drop removed fields (includes both body fields and filters) and map old
+        # field names to new ones for filtering, in one pass
+        OrganizationCompatMixin._normalize_kwargs(kwargs)
 
         return super().list(*args, **kwargs)  # type: ignore[no-any-return,misc]
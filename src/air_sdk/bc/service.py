@@ -5,11 +5,14 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from functools import cached_property
 from typing import TYPE_CHECKING, Any
 
+from air_sdk import const
 from air_sdk.bc.base import AirModelCompatMixin
 from air_sdk.bc.decorators import deprecated
-from air_sdk.bc.utils import deprecation_warn, drop_removed_fields, map_field_names
+from air_sdk.bc.utils import deprecation_warn_once
 
 if TYPE_CHECKING:
     from air_sdk.air_model import PrimaryKey
@@ -42,9 +45,15 @@ class ServiceCompatMixin(AirModelCompatMixin):
     }
 
     # Fields that were removed in v3
-    _REMOVED_FIELDS: list[str] = []
+    _REMOVED_FIELDS: frozenset[str] = frozenset()
 
-    @property
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Invalidate the cached simulation whenever the interface is reassigned."""
+        if name == 'interface':
+            self.__dict__.pop('simulation', None)
+        super().__setattr__(name, value)
+
+    @cached_property
     def simulation(self) -> Any:
         """v1/v2 BC: Get simulation via interface → node → simulation chain.
 
@@ -52,6 +61,8 @@ class ServiceCompatMixin(AirModelCompatMixin):
         service.simulation. In v3, simulation is derived from the interface relationship:
         service.interface → Interface.node → Node.simulation
 
+        The result is cached on the instance and cleared when `interface` is set
+        (including during refresh).
 
         Returns:
             Simulation object
@@ -99,8 +110,7 @@ class ServiceEndpointAPICompatMixin:
         Handles v1/v2 'node_name:interface_name' string format by resolving
         it to an interface ID using the provided simulation context.
         """
-        drop_removed_fields(kwargs, ServiceCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, ServiceCompatMixin._FIELD_MAPPINGS)
+        ServiceCompatMixin._normalize_kwargs(kwargs)
 
         # v1/v2 BC: Handle 'node:interface' string format
         if (
@@ -116,10 +126,11 @@ class ServiceEndpointAPICompatMixin:
                     'a simulation context. Please provide the simulation parameter.'
                 )
 
-            deprecation_warn(
+            deprecation_warn_once(
+                f'{__name__}.interface_string',
                 "Using 'node:interface' string format is deprecated. "
                 "Use sim.create_service(node_name='name', interface_name='name', ...) "
-                'or provide an explicit interface ID.'
+                'or provide an explicit interface ID.',
             )
 
             kwargs['interface'] = self._resolve_interface_string(
@@ -134,11 +145,20 @@ class ServiceEndpointAPICompatMixin:
         # Call parent create
         return super().create(*args, **kwargs)  # type: ignore[misc, no-any-return]
 
+    @cached_property
+    def _interface_id_cache(self) -> OrderedDict[tuple[str, str, str], str]:
+        """LRU cache of (simulation ID, node name, interface name) → interface ID."""
+        return OrderedDict()
+
     def _resolve_interface_string(
         self, interface_str: str, simulation: Simulation | PrimaryKey
     ) -> str:
         """Resolve v1/v2 'node_name:interface_name' format to interface ID.
 
+        Resolved IDs are remembered per endpoint (up to
+        const.MAX_INTERFACE_RESOLVE_CACHE_SIZE entries), so creating many services
+        against the same interfaces only looks each one up once.
+
         Args:
             interface_str: Interface in format 'node_name:interface_name'
             simulation: Simulation ID or Simulation object to scope the search
@@ -149,7 +169,7 @@ class ServiceEndpointAPICompatMixin:
         Raises:
             ValueError: If format invalid or interface not found
         """
-        # Ensure we have a Simulation object
+        # Used to tell Simulation objects apart from simulation IDs
         from air_sdk.endpoints.simulations import Simulation
 
         try:
@@ -159,35 +179,46 @@ class ServiceEndpointAPICompatMixin:
                 '`interface` must be in the format "node_name:interface_name"'
             )
 
-        sim: Simulation
-        if isinstance(simulation, Simulation):
-            sim = simulation
-        else:
-            sim = self.__api__.simulations.get(simulation)  # type: ignore[attr-defined]
-
-        # Find the node by name within the simulation
-        node_obj = next(sim.nodes.list(name=node_name), None)
+        sim_id = str(simulation.id if isinstance(simulation, Simulation) else simulation)
+        cache_key = (sim_id, node_name, interface_name)
+        cache = self._interface_id_cache
+        cached_id = cache.get(cache_key)
+        if cached_id is not None:
+            cache.move_to_end(cache_key)
+            return cached_id
+
+        # Find the node by name within the simulation. Filtering nodes by simulation
+        # ID directly avoids fetching the simulation itself when only an ID is given.
+        # Only the first match is used, so request a single-item page.
+        node_obj = next(
+            self.__api__.nodes.list(simulation=sim_id, name=node_name, limit=1),  # type: ignore[attr-defined]
+            None,
+        )
         if not node_obj:
-            raise ValueError(f'Node "{node_name}" not found in simulation "{sim.id}"')
+            raise ValueError(f'Node "{node_name}" not found in simulation "{sim_id}"')
 
         # Find the interface by name on the node
         interface_obj = next(
-            self.__api__.interfaces.list(node=node_obj.id, name=interface_name),  # type: ignore[attr-defined]
+            self.__api__.interfaces.list(node=node_obj.id, name=interface_name, limit=1),  # type: ignore[attr-defined]
             None,
         )
         if not interface_obj:
             raise ValueError(
                 f'Interface "{interface_name}" not found on node "{node_name}"'
             )
-        return str(interface_obj.id)
+
+        interface_id = str(interface_obj.id)
+        cache[cache_key] = interface_id
+        if len(cache) > const.MAX_INTERFACE_RESOLVE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return interface_id
 
     def list(self, *args: Any, **kwargs: Any) -> Any:
         """List services with v1/v2 backward compatibility.
 
         Maps filter field names from v1/v2 SDK.
         """
-        drop_removed_fields(kwargs, ServiceCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, ServiceCompatMixin._FIELD_MAPPINGS)
+        ServiceCompatMixin._normalize_kwargs(kwargs)
 
         # Call parent list
         return super().list(*args, **kwargs)  # type: ignore[misc]
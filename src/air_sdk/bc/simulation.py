@@ -9,15 +9,15 @@ Simulation-specific backward compatibility for v1/v2 SDK.
 from __future__ import annotations
 
 from datetime import timedelta
-from typing import TYPE_CHECKING, Any, cast
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, cast
 
 from air_sdk.air_model import PrimaryKey
 from air_sdk.bc.base import AirModelCompatMixin
 from air_sdk.bc.decorators import deprecated
 from air_sdk.bc.utils import (
     deprecation_warn,
-    drop_removed_fields,
-    handle_boolean_datetime_fields,
+    deprecation_warn_once,
     map_field_names,
 )
 from air_sdk.types import SimState
@@ -25,6 +25,28 @@ from air_sdk.types import SimState
 if TYPE_CHECKING:
     from air_sdk.endpoints.simulations import Simulation
 
+# How far the legacy extend() pushes sleep_at forward
+_EXTEND_DELTA = timedelta(hours=12)
+
+# Boolean datetime field mappings: bool field → datetime field (v1/v2 → v3).
+# Module-level so __getattr__ can read it without going through
+# AirModel.__getattribute__.
+_BOOLEAN_DATETIME_FIELDS = {
+    'expires': 'expires_at',
+    'sleep': 'sleep_at',
+}
+
+
+def _invert_state_aliases(
+    old_to_new: dict[str, tuple[str, ...]],
+) -> dict[str, frozenset[str]]:
+    """Build a new state → old state aliases index from an old → new state mapping."""
+    new_to_old: dict[str, set[str]] = {}
+    for old_state, new_states in old_to_new.items():
+        for new_state in new_states:
+            new_to_old.setdefault(SimState(new_state).value, set()).add(old_state)
+    return {state: frozenset(aliases) for state, aliases in new_to_old.items()}
+
 
 class SimulationState(str):
     """A string subclass that provides BC for simulation state comparisons.
@@ -37,29 +59,45 @@ class SimulationState(str):
         >>> sim.state == 'LOADED'  # True (BC mapping)
     """
 
-    # Mapping: old state name → list of new state names
-    _OLD_TO_NEW: dict[str, list[str]] = {
-        'LOADING': [
+    # One instance is created per Simulation; no per-instance __dict__ is needed
+    __slots__ = ()
+
+    # Mapping: old state name → new state names
+    _OLD_TO_NEW: dict[str, tuple[str, ...]] = {
+        'LOADING': (
             SimState.BOOTING,
             SimState.PREPARE_BOOT,
             SimState.REQUESTING,
             SimState.PROVISIONING,
-        ],
-        'LOADED': [
+        ),
+        'LOADED': (
             SimState.ACTIVE,
             SimState.PREPARE_REBUILD,
             SimState.REBUILDING,
-        ],
-        'NEW': [SimState.INACTIVE],
-        'STORED': [SimState.INACTIVE],
-        'STORING': [
+        ),
+        'NEW': (SimState.INACTIVE,),
+        'STORED': (SimState.INACTIVE,),
+        'STORING': (
             SimState.SHUTTING_DOWN,
             SimState.PREPARE_SHUTDOWN,
             SimState.SAVING,
             SimState.PREPARE_PURGE,
             SimState.PURGING,
-        ],
-        'SNAPSHOT': [SimState.DEMO],
+        ),
+        'SNAPSHOT': (SimState.DEMO,),
+    }
+
+    # Reverse index derived from _OLD_TO_NEW: new state name → old aliases matching it
+    _NEW_TO_OLD: dict[str, frozenset[str]] = _invert_state_aliases(_OLD_TO_NEW)
+
+    # Deprecation message for each old state name, formatted once
+    _DEPRECATION_MESSAGES: dict[str, str] = {
+        old_state: (
+            f"Simulation state '{old_state}' is deprecated and is being mapped to "
+            f'new state(s): {", ".join(new_states)}. '
+            f'Please update your code to use the new state names.'
+        )
+        for old_state, new_states in _OLD_TO_NEW.items()
     }
 
     def __eq__(self, other: object) -> bool:
@@ -72,15 +110,11 @@ class SimulationState(str):
 
         # Check if `other` is an old alias that maps to our current value
         # e.g., self='ACTIVE', other='LOADED' → True
-        if other in self._OLD_TO_NEW:
-            # Warn about deprecated state name usage
-            mapped_states = ', '.join(self._OLD_TO_NEW[other])
-            deprecation_warn(
-                f"Simulation state '{other}' is deprecated and is being mapped to "
-                f'new state(s): {mapped_states}. '
-                f'Please update your code to use the new state names.'
-            )
-            return str(self) in self._OLD_TO_NEW[other]
+        deprecation_message = self._DEPRECATION_MESSAGES.get(other)
+        if deprecation_message is not None:
+            # Warn about deprecated state name usage, once per alias
+            deprecation_warn_once(f'{__name__}.state:{other}', deprecation_message)
+            return other in self._NEW_TO_OLD.get(self, ())
 
         return False
 
@@ -111,6 +145,12 @@ def _map_disable_auto_oob_dhcp_to_enable_dhcp(kwargs: dict[str, Any]) -> None:
             )
 
 
+# Keys routed to the dedicated OOB/NetQ endpoints (before or after v3 mapping)
+_OOB_NETQ_KEYS = frozenset(
+    {'auto_oob_enabled', 'disable_auto_oob_dhcp', 'enable_dhcp', 'auto_netq_enabled'}
+)
+
+
 def _extract_oob_netq_fields(
     kwargs: dict[str, Any],
 ) -> tuple[bool | None, bool | None, bool | None]:
@@ -136,6 +176,49 @@ def _extract_oob_netq_fields(
     return auto_oob_enabled, enable_dhcp, auto_netq_enabled
 
 
+def _apply_oob_netq_fields(
+    kwargs: dict[str, Any],
+    *,
+    enable_auto_oob: Callable[..., Any],
+    disable_auto_oob: Callable[[], Any],
+    enable_auto_netq: Callable[[], Any],
+    disable_auto_netq: Callable[[], Any],
+) -> None:
+    """Extract OOB/NetQ fields from kwargs and route them to dedicated endpoints.
+
+    Note: NetQ depends on OOB, so we handle in this order:
+    1. Disable NetQ (if needed)
+    2. Enable/disable OOB
+    3. Enable NetQ (if needed)
+
+    Args:
+        kwargs: Dictionary to extract OOB/NetQ fields from (modified in-place)
+        enable_auto_oob: Enables auto OOB; accepts an optional enable_dhcp kwarg
+        disable_auto_oob: Disables auto OOB
+        enable_auto_netq: Enables auto NetQ
+        disable_auto_netq: Disables auto NetQ
+    """
+    auto_oob_enabled, enable_dhcp, auto_netq_enabled = _extract_oob_netq_fields(kwargs)
+
+    # Step 1: Disable NetQ first (if disabling) since NetQ requires OOB
+    if auto_netq_enabled is False:
+        disable_auto_netq()
+
+    # Step 2: Handle OOB enable/disable
+    if auto_oob_enabled is not None:
+        if auto_oob_enabled:
+            enable_kwargs = {}
+            if enable_dhcp is not None:
+                enable_kwargs['enable_dhcp'] = enable_dhcp
+            enable_auto_oob(**enable_kwargs)
+        else:
+            disable_auto_oob()
+
+    # Step 3: Enable NetQ last (if enabling) since it requires OOB to be enabled
+    if auto_netq_enabled is True:
+        enable_auto_netq()
+
+
 class SimulationCompatMixin(AirModelCompatMixin):
     """Mixin providing Simulation-specific v1/v2 SDK backward compatibility.
 
@@ -154,23 +237,22 @@ class SimulationCompatMixin(AirModelCompatMixin):
         'start': 'attempt_start',
     }
 
-    # Boolean datetime field mappings: bool field → datetime field (v1/v2 → v3)
-    _BOOLEAN_DATETIME_FIELDS = {
-        'expires': 'expires_at',
-        'sleep': 'sleep_at',
-    }
+    # Boolean datetime field mappings (module-level constant, exposed for the base mixin)
+    _BOOLEAN_DATETIME_FIELDS = _BOOLEAN_DATETIME_FIELDS
 
     # Fields and filters that were removed in v3
-    _REMOVED_FIELDS = ['organization', 'preferred_worker', 'write_ok']
+    _REMOVED_FIELDS = frozenset({'organization', 'preferred_worker', 'write_ok'})
 
     def __post_init__(self, _api: Any) -> None:
         """Convert state field to SimulationState for BC comparisons."""
         # Call parent __post_init__ first
         super().__post_init__(_api)  # type: ignore[misc]
 
-        # Wrap state in SimulationState if it's a plain string
-        state = getattr(self, 'state', None)
-        if state is not None and not isinstance(state, SimulationState):
+        # Wrap state in SimulationState if it's a plain string. `state` is a plain
+        # (non-FK, non-lazy) field, so it is read straight from the instance dict
+        # rather than through AirModel.__getattribute__'s field lookup.
+        state = self.__dict__.get('state')
+        if state is not None and type(state) is not SimulationState:
             object.__setattr__(self, 'state', SimulationState(state))
 
     @property
@@ -189,12 +271,13 @@ class SimulationCompatMixin(AirModelCompatMixin):
         Field mappings and removed fields are handled by AirModelCompatMixin.
         """
         # Computed boolean fields for v1/v2 compatibility
-        if name == 'sleep':
-            return super().__getattribute__('sleep_at') is not None
-        if name == 'expires':
-            return super().__getattribute__('expires_at') is not None
+        datetime_field = _BOOLEAN_DATETIME_FIELDS.get(name)
+        if datetime_field is not None:
+            return super().__getattribute__(datetime_field) is not None
 
-        return super().__getattr__(name)
+        # Called directly (no super() proxy); AirModelCompatMixin is the next class
+        # defining __getattr__ in every model's MRO
+        return AirModelCompatMixin.__getattr__(self, name)
 
     def enable_auto_oob(self, **kwargs: Any) -> None:
         """Enable auto OOB with v1/v2 BC for disable_auto_oob_dhcp parameter."""
@@ -219,36 +302,18 @@ class SimulationCompatMixin(AirModelCompatMixin):
             This method overrides the parent update() to provide field mapping.
         """
         # Clean up kwargs for v3 compatibility
-        handle_boolean_datetime_fields(kwargs, self._BOOLEAN_DATETIME_FIELDS)
-        drop_removed_fields(kwargs, self._REMOVED_FIELDS)
-        map_field_names(kwargs, self._FIELD_MAPPINGS)
+        self._normalize_kwargs(kwargs)
 
         # Extract and route OOB/NetQ fields to dedicated endpoints
-        # Note: NetQ depends on OOB, so we handle in this order:
-        # 1. Disable NetQ (if needed)
-        # 2. Enable/disable OOB
-        # 3. Enable NetQ (if needed)
-        auto_oob_enabled, enable_dhcp, auto_netq_enabled = _extract_oob_netq_fields(
-            kwargs
-        )
-
-        # Step 1: Disable NetQ first (if disabling) since NetQ requires OOB
-        if auto_netq_enabled is False:
-            self.disable_auto_netq()
-
-        # Step 2: Handle OOB enable/disable
-        if auto_oob_enabled is not None:
-            if auto_oob_enabled:
-                enable_kwargs = {}
-                if enable_dhcp is not None:
-                    enable_kwargs['enable_dhcp'] = enable_dhcp
-                self.enable_auto_oob(**enable_kwargs)
-            else:
-                self.disable_auto_oob()
-
-        # Step 3: Enable NetQ last (if enabling) since it requires OOB to be enabled
-        if auto_netq_enabled is True:
-            self.enable_auto_netq()
+        # (skipped entirely in the common case where none of them are passed)
+        if not _OOB_NETQ_KEYS.isdisjoint(kwargs):
+            _apply_oob_netq_fields(
+                kwargs,
+                enable_auto_oob=self.enable_auto_oob,
+                disable_auto_oob=self.disable_auto_oob,
+                enable_auto_netq=self.enable_auto_netq,
+                disable_auto_netq=self.disable_auto_netq,
+            )
 
         # Call the parent update() method for remaining fields
         if kwargs:  # Only call if there are remaining fields
@@ -468,7 +533,7 @@ class SimulationCompatMixin(AirModelCompatMixin):
             )
 
         # Calculate new sleep_at: add 12 hours (legacy behavior)
-        new_sleep_at = current_sleep_at + timedelta(hours=12)
+        new_sleep_at = current_sleep_at + _EXTEND_DELTA
 
         # Use v3 method to set sleep time (API will enforce constraints)
         self.set_sleep_time(new_sleep_at)
@@ -486,6 +551,12 @@ class SimulationEndpointAPICompatMixin:
     where v1/v2 used different parameter or field names than v3.
     """
 
+    # Every create() kwarg that needs compat handling; calls using none of them are
+    # passed straight through
+    _CREATE_COMPAT_KEYS = SimulationCompatMixin.__bc_legacy_keys__.union(
+        {'topology', 'topology_data', 'attempt_start'}
+    )
+
     def patch(self, pk: PrimaryKey, **kwargs: Any) -> Simulation:
         """Patch a simulation with v1/v2 backward compatibility.
 
@@ -495,38 +566,27 @@ class SimulationEndpointAPICompatMixin:
         - Removed fields (see SimulationCompatMixin._REMOVED_FIELDS)
         - Routes OOB/NetQ fields to dedicated endpoints
         """
-        handle_boolean_datetime_fields(
-            kwargs, SimulationCompatMixin._BOOLEAN_DATETIME_FIELDS
-        )
-        drop_removed_fields(kwargs, SimulationCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, SimulationCompatMixin._FIELD_MAPPINGS)
+        SimulationCompatMixin._normalize_kwargs(kwargs)
 
         # Extract and route OOB/NetQ fields to dedicated endpoints
-        # Note: NetQ depends on OOB, so we handle in this order:
-        # 1. Disable NetQ (if needed)
-        # 2. Enable/disable OOB
-        # 3. Enable NetQ (if needed)
-        auto_oob_enabled, enable_dhcp, auto_netq_enabled = _extract_oob_netq_fields(
-            kwargs
-        )
-
-        # Step 1: Disable NetQ first (if disabling) since NetQ requires OOB
-        if auto_netq_enabled is False:
-            self.disable_auto_netq(simulation=pk)  # type: ignore[attr-defined]
-
-        # Step 2: Handle OOB enable/disable
-        if auto_oob_enabled is not None:
-            if auto_oob_enabled:
-                enable_kwargs = {}
-                if enable_dhcp is not None:
-                    enable_kwargs['enable_dhcp'] = enable_dhcp
-                self.enable_auto_oob(simulation=pk, **enable_kwargs)
-            else:
-                self.disable_auto_oob(simulation=pk)  # type: ignore[attr-defined]
-
-        # Step 3: Enable NetQ last (if enabling) since it requires OOB to be enabled
-        if auto_netq_enabled is True:
-            self.enable_auto_netq(simulation=pk)  # type: ignore[attr-defined]
+        # (skipped entirely in the common case where none of them are passed)
+        if not _OOB_NETQ_KEYS.isdisjoint(kwargs):
+            _apply_oob_netq_fields(
+                kwargs,
+                enable_auto_oob=partial(self.enable_auto_oob, simulation=pk),
+                disable_auto_oob=partial(
+                    self.disable_auto_oob,  # type: ignore[attr-defined]
+                    simulation=pk,
+                ),
+                enable_auto_netq=partial(
+                    self.enable_auto_netq,  # type: ignore[attr-defined]
+                    simulation=pk,
+                ),
+                disable_auto_netq=partial(
+                    self.disable_auto_netq,  # type: ignore[attr-defined]
+                    simulation=pk,
+                ),
+            )
 
         # Call parent patch for remaining fields, or get the simulation if no fields left
         if kwargs:
@@ -544,9 +604,8 @@ class SimulationEndpointAPICompatMixin:
         - disable_auto_oob_dhcp → enable_dhcp (inverted) for list filters
         """
         _map_disable_auto_oob_dhcp_to_enable_dhcp(kwargs)
-        # Drop removed fields (includes both body fields and filters)
-        drop_removed_fields(kwargs, SimulationCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, SimulationCompatMixin._FIELD_MAPPINGS)
+        # Drop removed fields (includes both body fields and filters) and map names
+        SimulationCompatMixin._normalize_kwargs(kwargs)
         return super().list(*args, **kwargs)  # type: ignore[misc]
 
     def enable_auto_oob(self, *, simulation: PrimaryKey, **kwargs: Any) -> None:
@@ -573,11 +632,9 @@ class SimulationEndpointAPICompatMixin:
         if format_type is None or content is None:
             raise ValueError("'format' and 'content' parameters are required")
 
-        # Normalize format to uppercase
-        format_upper = format_type.upper()
-
-        # v2 create_from only supported JSON
-        if format_upper != 'JSON':
+        # v2 create_from only supported JSON (case-insensitive); only spellings other
+        # than the canonical 'JSON' pay for an upper() copy
+        if format_type != 'JSON' and format_type.upper() != 'JSON':
             raise ValueError(
                 f"create_from only supports format='JSON'. Got: '{format_type}'. "
                 f'For DOT format, use import_from_dot() instead.'
@@ -585,7 +642,7 @@ class SimulationEndpointAPICompatMixin:
 
         # Build a manifest and pass to import_from_simulation_manifest
         # This lets the v3 method handle all file/path/string resolution
-        simulation_manifest = {'format': format_upper, 'content': content, **kwargs}
+        simulation_manifest = {'format': 'JSON', 'content': content, **kwargs}
         return self.import_from_simulation_manifest(  # type: ignore[attr-defined]
             simulation_manifest=simulation_manifest,
             attempt_start=attempt_start,
@@ -597,12 +654,12 @@ class SimulationEndpointAPICompatMixin:
         v1 BC: If 'topology' or 'topology_data' is provided, redirects to create_from()
         v2 BC: Maps field names and drops fields not supported in v3
         """
+        # Pure v3 calls need no cleanup, redirect or start handling
+        if self._CREATE_COMPAT_KEYS.isdisjoint(kwargs):
+            return super().create(*args, **kwargs)  # type: ignore[misc]
+
         # Clean up kwargs for v3 (do this once at the start)
-        handle_boolean_datetime_fields(
-            kwargs, SimulationCompatMixin._BOOLEAN_DATETIME_FIELDS
-        )
-        drop_removed_fields(kwargs, SimulationCompatMixin._REMOVED_FIELDS)
-        map_field_names(kwargs, SimulationCompatMixin._FIELD_MAPPINGS)
+        SimulationCompatMixin._normalize_kwargs(kwargs)
 
         # v1 BC: topology/topology_data → create_from()
         if 'topology' in kwargs or 'topology_data' in kwargs:
@@ -17,14 +17,19 @@ if TYPE_CHECKING:
     from air_sdk.endpoints.user_configs import UserConfig
 
 # Fields that were removed in v3 (were in v2 API but not in v3)
+# UserConfig has no AirModelCompatMixin, so there are no per-class __bc_* sets to
+# normalize against; these are dropped with drop_removed_fields() instead, which
+# returns early when none of them is passed.
 # TODO: Remove organization_budget and organization(?) once
 # ResourceBudget endpoint is implemented in v3:
-_USER_CONFIG_REMOVED_FIELDS = [
-    'organization',
-    'organization_budget',
-    'owner',
-    'owner_budget',
-]
+_USER_CONFIG_REMOVED_FIELDS = frozenset(
+    {
+        'organization',
+        'organization_budget',
+        'owner',
+        'owner_budget',
+    }
+)
 
 
 class UserConfigEndpointAPICompatMixin(BaseEndpointAPICompatMixin):
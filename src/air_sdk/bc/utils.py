@@ -7,8 +7,12 @@ Utility functions for backward compatibility layer.
 """
 
 import inspect
+import re
+import sys
 import warnings
-from typing import Any, Callable
+from dataclasses import MISSING
+from types import FrameType
+from typing import Any, Callable, Collection, Mapping
 
 from air_sdk.const import MAX_STACKLEVEL, SDK_ROOT
 
@@ -23,15 +27,20 @@ def _caller_stacklevel() -> int:
     The returned value accounts for the fact that this function's own
     frame will be gone by the time warnings.warn() uses the stacklevel.
 
+    Frames are walked directly via ``f_back`` rather than ``inspect.stack()``,
+    which would build a FrameInfo (and read source context) for every frame.
+
     Returns:
         The stacklevel to pass to warnings.warn().
         Falls back to 1 if no external frame is found.
     """
-    for i, frame_info in enumerate(inspect.stack(), 1):
-        if i > MAX_STACKLEVEL:
+    frame: FrameType | None = sys._getframe()
+    for i in range(1, MAX_STACKLEVEL + 1):
+        if frame is None:
             break
-        if not frame_info.filename.startswith(SDK_ROOT):
+        if not frame.f_code.co_filename.startswith(SDK_ROOT):
             return max(i - 1, 1)
+        frame = frame.f_back
     return 1
 
 
@@ -48,6 +57,68 @@ def deprecation_warn(message: str) -> None:
     warnings.warn(message, DeprecationWarning, stacklevel=_caller_stacklevel())
 
 
+# Keys of one-shot deprecation warnings that have already been shown
+_WARNED_KEYS: set[str] = set()
+
+
+def _filter_matches(pattern: re.Pattern[str] | str | None, text: str) -> bool:
+    """Match a warnings filter field; the built-in filters use plain strings."""
+    if pattern is None:
+        return True
+    if isinstance(pattern, str):
+        return pattern == text
+    return pattern.match(text) is not None
+
+
+def _deprecation_warning_ignored(message: str, frame: FrameType) -> bool:
+    """Check whether the active warning filters ignore `message` raised from `frame`.
+
+    Mirrors the filter lookup of warnings.warn(): the first filter matching the
+    message, category, module and line decides. When none matches, the default
+    action shows the warning.
+    """
+    module = frame.f_globals.get('__name__', '<string>')
+    lineno = frame.f_lineno
+    for action, msg, category, mod, filter_lineno in warnings.filters:
+        if (
+            _filter_matches(msg, message)
+            and issubclass(DeprecationWarning, category)
+            and _filter_matches(mod, module)
+            and (filter_lineno == 0 or filter_lineno == lineno)
+        ):
+            return action == 'ignore'
+    return False
+
+
+def deprecation_warn_once(key: str, message: str) -> None:
+    """Emit a DeprecationWarning only the first time `key` is shown in this process.
+
+    A key is only marked once its warning gets past the active warning filters, so
+    a first hit under an 'ignore' filter (including the default DeprecationWarning
+    filters for code outside __main__) does not use it up. Later calls with a shown
+    key return without touching the warnings machinery or walking the call stack.
+
+    Args:
+        key: Identifies the deprecated usage (e.g. a function's qualified name).
+        message: The deprecation warning message.
+    """
+    if key in _WARNED_KEYS:
+        return
+    stacklevel = _caller_stacklevel()
+    if _deprecation_warning_ignored(message, sys._getframe(stacklevel - 1)):
+        return
+    warnings.warn(message, DeprecationWarning, stacklevel=stacklevel)
+    _WARNED_KEYS.add(key)
+
+
+def reset_deprecation_warnings() -> None:
+    """Forget which one-shot deprecation warnings were shown, so they warn again.
+
+    Useful in test suites that assert on the same deprecation in several tests.
+    """
+    _WARNED_KEYS.clear()
+
+
 # NOTE: This function is currently not in use because we use .pyi stub files
 # for type hints, which means inspect.signature() cannot extract the actual
 # runtime function signatures. Keeping this for potential future use if we
@@ -89,9 +160,67 @@ def map_positional_args(
     return mapped
 
 
+def _quote_fields(fields: list[str]) -> str:
+    """Format a non-empty list of field names as "'a', 'b'" without a generator."""
+    return "'" + "', '".join(fields) + "'"
+
+
+def _warn_dropped_fields(dropped_fields: list[str]) -> None:
+    """Warn once about all parameters dropped because v3 no longer supports them."""
+    if dropped_fields:
+        deprecation_warn(
+            f'The following parameters are not supported in the current air-api '
+            f'version and will be ignored: {_quote_fields(dropped_fields)}. '
+            f'These parameters were available in older air-api versions.'
+        )
+
+
+def _warn_mapped_fields(mapped_fields: list[str]) -> None:
+    """Warn once about all parameters renamed to their v3 names."""
+    if mapped_fields:
+        fields_str = ', '.join(mapped_fields)
+        deprecation_warn(
+            f'The following field name(s) have been changed in the current '
+            f'air-api version: {fields_str}. '
+            f'Please update your code to use the new names.'
+        )
+
+
+def _warn_boolean_datetime_fields(
+    ignored_fields: list[str],
+    converted_fields: list[str],
+    true_fields: list[str],
+    field_mappings: Mapping[str, str],
+) -> None:
+    """Warn about boolean fields that were ignored, converted or left unconverted."""
+    # Warn about fields ignored because datetime field was provided
+    if ignored_fields:
+        deprecation_warn(
+            f'Ignored boolean field(s): {", ".join(ignored_fields)}. '
+            f'The datetime field takes precedence.'
+        )
+
+    # Warn about fields that were automatically converted
+    if converted_fields:
+        deprecation_warn(
+            f'Automatically converted: {", ".join(converted_fields)}. '
+            f'Consider using the datetime field equivalents directly.'
+        )
+
+    # Warn about True values that couldn't be converted
+    if true_fields:
+        datetime_fields = [field_mappings[field] for field in true_fields]
+        datetime_fields_str = _quote_fields(datetime_fields)
+        deprecation_warn(
+            f'The {", ".join(true_fields)} boolean parameter(s) are not '
+            f'supported in the current air-api version. Use '
+            f'{datetime_fields_str} with datetime values instead.'
+        )
+
+
 def drop_removed_fields(
     kwargs: dict[str, Any],
-    removed_fields: list[str],
+    removed_fields: Collection[str],
     critical_fields: list[str] | None = None,
     exclude_fields: list[str] | None = None,
 ) -> None:
@@ -100,7 +229,7 @@ def drop_removed_fields(
 
     Args:
         kwargs: Dictionary of keyword arguments to modify in-place
-        removed_fields: List of field names that are not supported (will warn)
+        removed_fields: Collection of field names that are not supported (will warn)
         critical_fields: List of field names that will raise an exception if present
         exclude_fields: List of field names to keep even if in removed_fields
 
@@ -140,35 +269,34 @@ def drop_removed_fields(
     """
     # fmt: on
     # Check for critical fields first (raise exception)
-    if critical_fields:
+    # isdisjoint() rejects the common no-critical-field case in C; the list is only
+    # built (in critical_fields order, for a stable message) when raising
+    if critical_fields and not kwargs.keys().isdisjoint(critical_fields):
         found_critical = [field for field in critical_fields if field in kwargs]
-        if found_critical:
-            fields_str = ', '.join(f"'{field}'" for field in found_critical)
-            raise ValueError(
-                f'The following parameters are not supported in the current '
-                f'air-api version and cannot be used: {fields_str}. These parameters '
-                f'had critical functionality in older air-api versions that is no '
-                f'longer available. Please remove them from your call.'
-            )
-
-    # Build the list of fields to actually drop (excluding specified fields)
-    exclude_set = set(exclude_fields) if exclude_fields else set()
-    fields_to_drop = [field for field in removed_fields if field not in exclude_set]
+        fields_str = _quote_fields(found_critical)
+        raise ValueError(
+            f'The following parameters are not supported in the current '
+            f'air-api version and cannot be used: {fields_str}. These parameters '
+            f'had critical functionality in older air-api versions that is no '
+            f'longer available. Please remove them from your call.'
+        )
+
+    # Nothing to drop in the common case; checked in C without building a list
+    if kwargs.keys().isdisjoint(removed_fields):
+        return
+
+    # Walk kwargs once; removed_fields is expected to be a set for hashed lookups.
+    # Iterating kwargs (not the set) keeps the warning's field order deterministic.
+    exclude_set = frozenset(exclude_fields) if exclude_fields else frozenset()
+    dropped_fields = [
+        field for field in kwargs if field in removed_fields and field not in exclude_set
+    ]
 
     # Drop non-critical removed fields and warn
-    dropped_fields = []
-    for field in fields_to_drop:
-        if field in kwargs:
-            kwargs.pop(field)
-            dropped_fields.append(field)
+    for field in dropped_fields:
+        del kwargs[field]
 
-    if dropped_fields:
-        dropped_fields_str = ', '.join(f"'{field}'" for field in dropped_fields)
-        deprecation_warn(
-            f'The following parameters are not supported in the current air-api '
-            f'version and will be ignored: {dropped_fields_str}. '
-            f'These parameters were available in older air-api versions.'
-        )
+    _warn_dropped_fields(dropped_fields)
 
 
 def map_field_names(
@@ -188,19 +316,116 @@ def map_field_names(
         >>> kwargs
         {'name': 'My Sim', 'creator': 'user@example.com'}
     """
+    # Nothing to rename in the common case; checked in C without walking either side
+    if kwargs.keys().isdisjoint(field_mappings):
+        return
+
     mapped_fields: list[str] = []
-    for old_name, new_name in field_mappings.items():
-        if old_name in kwargs:
-            kwargs[new_name] = kwargs.pop(old_name)
-            mapped_fields.append(f'{old_name} -> {new_name}')
+    if len(kwargs) < len(field_mappings):
+        # Few kwargs: probe the mapping with each kwarg instead
+        for old_name in list(kwargs):
+            mapped_name = field_mappings.get(old_name)
+            if mapped_name is not None:
+                kwargs[mapped_name] = kwargs.pop(old_name)
+                mapped_fields.append(f'{old_name} -> {mapped_name}')
+    else:
+        for old_name, new_name in field_mappings.items():
+            value = kwargs.pop(old_name, MISSING)
+            if value is not MISSING:
+                kwargs[new_name] = value
+                mapped_fields.append(f'{old_name} -> {new_name}')
+
+    _warn_mapped_fields(mapped_fields)
+
+
+def normalize_kwargs(
+    kwargs: dict[str, Any],
+    removed_fields: Collection[str] = frozenset(),
+    field_mappings: Mapping[str, str] | None = None,
+    *,
+    exclude_fields: Collection[str] | None = None,
+    map_first: bool = False,
+    boolean_datetime_fields: Mapping[str, str] | None = None,
+) -> None:
+    """Drop removed fields and map renamed fields in a single pass over kwargs.
 
-    if mapped_fields:
-        fields_str = ', '.join(mapped_fields)
-        deprecation_warn(
-            f'The following field name(s) have been changed in the current '
-            f'air-api version: {fields_str}. '
-            f'Please update your code to use the new names.'
-        )
+    Equivalent to drop_removed_fields() followed by map_field_names(), or the
+    reverse order when map_first is True, and emits the same warnings. When
+    boolean_datetime_fields is given, handle_boolean_datetime_fields() is applied
+    first within the same pass.
+
+    Args:
+        kwargs: Dictionary of keyword arguments to modify in-place
+        removed_fields: Collection of field names that are not supported (will warn)
+        field_mappings: Dictionary mapping old field names to new ones
+        exclude_fields: Collection of field names to keep even if in removed_fields
+        map_first: Map field names before dropping, so a renamed field that is
+            itself unsupported (e.g. read-only) is dropped as well
+        boolean_datetime_fields: Mapping of boolean field names to datetime field
+            names (see handle_boolean_datetime_fields())
+
+    Example:
+        >>> kwargs = {'name': 'test', 'metadata': 'old', 'title': 'My Sim'}
+        >>> normalize_kwargs(kwargs, {'metadata'}, {'title': 'name'})
+        >>> kwargs
+        {'name': 'My Sim'}
+    """
+    mappings = field_mappings or {}
+    bool_fields = boolean_datetime_fields or {}
+
+    # Fast path: callers using only v3 names have nothing to rewrite
+    keys = kwargs.keys()
+    if (
+        keys.isdisjoint(removed_fields)
+        and keys.isdisjoint(mappings)
+        and keys.isdisjoint(bool_fields)
+    ):
+        return
+
+    exclude_set = frozenset(exclude_fields) if exclude_fields else frozenset()
+    ignored_fields: list[str] = []
+    converted_fields: list[str] = []
+    true_fields: list[str] = []
+    dropped_fields: list[str] = []
+    mapped_fields: list[str] = []
+
+    for name in list(kwargs):
+        # A field may already be gone if an earlier rename overwrote and dropped it
+        if name not in kwargs:
+            continue
+        datetime_field = bool_fields.get(name)
+        if datetime_field is not None:
+            value = kwargs.pop(name)
+            # If datetime field is already provided, prioritize it and ignore boolean
+            if datetime_field in kwargs:
+                ignored_fields.append(f'{name} (using {datetime_field} instead)')
+            elif value is False:
+                kwargs[datetime_field] = None
+                converted_fields.append(f'{name} = False -> {datetime_field} = None')
+            elif value is True:
+                true_fields.append(name)
+            continue
+        if map_first and name in mappings:
+            new_name = mappings[name]
+            kwargs[new_name] = kwargs.pop(name)
+            mapped_fields.append(f'{name} -> {new_name}')
+            name = new_name
+        if name in removed_fields and name not in exclude_set:
+            del kwargs[name]
+            dropped_fields.append(name)
+        elif not map_first and name in mappings:
+            new_name = mappings[name]
+            kwargs[new_name] = kwargs.pop(name)
+            mapped_fields.append(f'{name} -> {new_name}')
+
+    _warn_boolean_datetime_fields(
+        ignored_fields, converted_fields, true_fields, bool_fields
+    )
+    if map_first:
+        _warn_mapped_fields(mapped_fields)
+    _warn_dropped_fields(dropped_fields)
+    if not map_first:
+        _warn_mapped_fields(mapped_fields)
 
 
 def handle_boolean_datetime_fields(
@@ -260,26 +485,6 @@ def handle_boolean_datetime_fields(
                 # Can't convert True without a datetime value
                 true_fields.append(bool_field)
 
-    # Warn about fields ignored because datetime field was provided
-    if ignored_fields:
-        deprecation_warn(
-            f'Ignored boolean field(s): {", ".join(ignored_fields)}. '
-            f'The datetime field takes precedence.'
-        )
-
-    # Warn about fields that were automatically converted
-    if converted_fields:
-        deprecation_warn(
-            f'Automatically converted: {", ".join(converted_fields)}. '
-            f'Consider using the datetime field equivalents directly.'
-        )
-
-    # Warn about True values that couldn't be converted
-    if true_fields:
-        datetime_fields = [field_mappings[field] for field in true_fields]
-        datetime_fields_str = ', '.join(f"'{field}'" for field in datetime_fields)
-        deprecation_warn(
-            f'The {", ".join(true_fields)} boolean parameter(s) are not '
-            f'supported in the current air-api version. Use '
-            f'{datetime_fields_str} with datetime values instead.'
-        )
+    _warn_boolean_datetime_fields(
+        ignored_fields, converted_fields, true_fields, field_mappings
+    )
@@ -1,12 +1,12 @@
 # SPDX-FileCopyrightText: Copyright (c) 2025-2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: MIT
 
-import configparser
 import os
 import platform
 import sys
 import webbrowser
 from datetime import datetime as dt
+from functools import cache
 from typing import Any
 
 import requests
@@ -17,20 +17,34 @@ import air_sdk
 from air_sdk import const, exceptions, utils
 
 
+@cache
+def _telemetry_headers() -> dict[str, str]:
+    """Build the telemetry headers once per process.
+
+    Deferred to first use rather than module import, since `air_sdk.__version__` is
+    not yet set while `air_sdk` imports this module.
+    """
+    tz_name = dt.now().astimezone().tzname() or 'Unknown'
+    return {
+        const.HTTPHeaders.AIR_SDK_SYS_VERSION: sys.version,
+        const.HTTPHeaders.AIR_SDK_VERSION: air_sdk.__version__,
+        const.HTTPHeaders.AIR_SDK_TIMEZONE: tz_name,
+        const.HTTPHeaders.AIR_SDK_PLATFORM: platform.platform(),
+    }
+
+
 class Client(requests.Session):
     """A session client for managing the execution of API requests."""
 
     def __init__(self, api_url: str):
         super().__init__()
-        self.headers.update({'content-type': 'application/json', 'Authorization': ''})
         self.api_url = utils.normalize_api_url(api_url)
         self.connect_timeout = const.DEFAULT_CONNECT_TIMEOUT
         self.read_timeout = const.DEFAULT_READ_TIMEOUT
         self.pagination_page_size = const.DEFAULT_PAGINATION_PAGE_SIZE
 
         # Set session headers
-        self.headers.update(self.get_basic_headers())
-        self.headers.update(self.get_telemetry_headers())
+        self.headers.update({**self.get_basic_headers(), **self.get_telemetry_headers()})
 
         # Set HTTP adapter for all requests
         adapter = self.get_http_adapter()
@@ -48,13 +62,8 @@ class Client(requests.Session):
     @staticmethod
     def get_telemetry_headers() -> dict[str, str]:
         """Return telemetry-specific headers for all requests."""
-        tz_name = dt.now().astimezone().tzname() or 'Unknown'
-        return {
-            const.HTTPHeaders.AIR_SDK_SYS_VERSION: sys.version,
-            const.HTTPHeaders.AIR_SDK_VERSION: air_sdk.__version__,
-            const.HTTPHeaders.AIR_SDK_TIMEZONE: tz_name,
-            const.HTTPHeaders.AIR_SDK_PLATFORM: platform.platform(),
-        }
+        # platform.platform() can spawn subprocesses; compute once and hand out copies
+        return dict(_telemetry_headers())
 
     def get_user_agent_header_value(self) -> str:
         """Return the user agent header value."""
@@ -84,6 +93,9 @@ class Client(requests.Session):
                 'or use AirApi.with_api_key(api_key=<YOUR_STARFLEET_API_KEY>) directly'
             )
 
+        # Only needed for SAK login, so keep it out of the SDK's import time
+        import configparser
+
         config = configparser.ConfigParser()
 
         # `ngc config set` uses semicolons for comments - ignore these
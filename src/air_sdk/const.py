@@ -8,6 +8,7 @@ Constants shared throughout the SDK.
 import os
 from datetime import timedelta
 from enum import Enum
+from functools import lru_cache
 from urllib.parse import ParseResult, urlparse
 
 SDK_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -32,6 +33,14 @@ MAX_RECOMMENDED_UPLOAD_WORKERS = 10
 # Default timeout per part upload
 DEFAULT_UPLOAD_TIMEOUT = timedelta(minutes=5)
 
+# Cloud-init bulk assignment configuration
+# Maximum concurrent node lookups used to resolve each node's simulation
+MAX_NODE_LOOKUP_WORKERS = 8
+
+# Service BC configuration
+# Maximum resolved 'node_name:interface_name' strings remembered per service endpoint
+MAX_INTERFACE_RESOLVE_CACHE_SIZE = 256
+
 
 class HTTPHeaders(str, Enum):
     """Known HTTP headers."""
@@ -60,18 +69,27 @@ AIR_API_URL = 'https://api.air-ngc.nvidia.com/'
 
 NGC_API_PROD_URL = 'https://api.ngc.nvidia.com'
 NGC_API_STG_URL = 'https://api.stg.ngc.nvidia.com'
+_NGC_API_PROD_PARSED = urlparse(NGC_API_PROD_URL)
+_NGC_API_STG_PARSED = urlparse(NGC_API_STG_URL)
+
+# The NGC URL helpers below are pure functions of the Air API URL, of which a process
+# typically uses one or two. ParseResult is an immutable tuple, so results are cached.
 
 
+@lru_cache(maxsize=8)
 def get_ngc_api_base_url(api_url: str) -> ParseResult:
     """Return the NGC API base URL based on the Air API URL.
 
-    If the api_url contains 'stg', the staging NGC URL is used.
+    If the api_url's host contains 'stg', the staging NGC URL is used.
     Otherwise, the production NGC URL is used.
     """
-    base = NGC_API_STG_URL if 'stg' in api_url else NGC_API_PROD_URL
-    return urlparse(base)
+    # Only the host decides, so e.g. a path segment containing 'stg' can't match.
+    # Scheme-less URLs have no parsed hostname; fall back to the whole string.
+    host = urlparse(api_url).hostname or api_url
+    return _NGC_API_STG_PARSED if 'stg' in host else _NGC_API_PROD_PARSED
 
 
+@lru_cache(maxsize=8)
 def get_ngc_device_login_url(api_url: str) -> ParseResult:
     """Return the NGC device login URL."""
     return get_ngc_api_base_url(api_url)._replace(
@@ -79,6 +97,7 @@ def get_ngc_device_login_url(api_url: str) -> ParseResult:
     )
 
 
+@lru_cache(maxsize=8)
 def get_ngc_token_url(api_url: str) -> ParseResult:
     """Return the NGC token URL."""
     return get_ngc_api_base_url(api_url)._replace(
@@ -86,6 +105,7 @@ def get_ngc_token_url(api_url: str) -> ParseResult:
     )
 
 
+@lru_cache(maxsize=8)
 def get_ngc_sak_details_url(api_url: str) -> ParseResult:
     """Return the NGC SAK details URL."""
     return get_ngc_api_base_url(api_url)._replace(
@@ -93,6 +113,7 @@ def get_ngc_sak_details_url(api_url: str) -> ParseResult:
     )
 
 
+@lru_cache(maxsize=8)
 def get_ngc_me_url(api_url: str) -> ParseResult:
     """Return the NGC user info URL."""
     return get_ngc_api_base_url(api_url)._replace(
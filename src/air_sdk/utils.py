@@ -192,18 +192,27 @@ def _resolve_type_hints_fallback(func: Callable[..., Any]) -> dict[str, Any]:
 
 def validate_payload_types(func: F) -> F:
     """A wrapper for validating the type of payload during create."""
+    # Resolved on first call and reused; a partial fallback result is not cached so
+    # that hints can still be fully resolved once forward references are importable
+    resolved_hints: dict[str, Any] | None = None
+    sig: inspect.Signature | None = None
 
     @wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        try:
-            # Try to get type hints with proper resolution
-            hints = get_type_hints(func)
-        except NameError:
-            # TYPE_CHECKING imports aren't available at runtime
-            # Use fallback to resolve only available types
-            hints = _resolve_type_hints_fallback(func)
-
-        sig = inspect.signature(func)
+        nonlocal resolved_hints, sig
+        if resolved_hints is not None:
+            hints = resolved_hints
+        else:
+            try:
+                # Try to get type hints with proper resolution
+                hints = resolved_hints = get_type_hints(func)
+            except NameError:
+                # TYPE_CHECKING imports aren't available at runtime
+                # Use fallback to resolve only available types
+                hints = _resolve_type_hints_fallback(func)
+
+        if sig is None:
+            sig = inspect.signature(func)
         bound_args = sig.bind(*args, **kwargs)
         bound_args.apply_defaults()
 
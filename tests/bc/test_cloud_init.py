@@ -0,0 +1,245 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from unittest import mock
+
+import pytest
+
+from air_sdk import AirApi, const
+from air_sdk.bc.cloud_init import CloudInitEndpointAPI
+from air_sdk.endpoints import Node
+
+
+@pytest.fixture
+def cloud_init_api(api: AirApi) -> CloudInitEndpointAPI:
+    return CloudInitEndpointAPI(api)
+
+
+def test_bulk_assign_fetches_each_node_once_concurrently(
+    api: AirApi,
+    cloud_init_api: CloudInitEndpointAPI,
+    make_node: Callable[[str, str], Node],
+) -> None:
+    simulation_by_node = {'node-1': 'sim-1', 'node-2': 'sim-2', 'node-3': 'sim-1'}
+    lookup_threads: set[str] = set()
+
+    def get_node(pk: str) -> Node:
+        lookup_threads.add(threading.current_thread().name)
+        return make_node(pk, simulation_by_node[pk])
+
+    with (
+        mock.patch.object(api.nodes, 'get', side_effect=get_node) as nodes_get,
+        mock.patch.object(api.simulations, 'node_bulk_assign') as node_bulk_assign,
+    ):
+        cloud_init_api.bulk_assign(
+            [
+                {'simulation_node': 'node-1', 'user_data': 'ud-1'},
+                {'simulation_node': 'node-2', 'user_data': 'ud-2'},
+                {'simulation_node': 'node-1', 'meta_data': 'md-1'},
+                {'simulation_node': 'node-3', 'user_data': 'ud-3'},
+                {'simulation_node': 'node-2', 'meta_data': 'md-2'},
+            ]
+        )
+
+    assert sorted(call.args[0] for call in nodes_get.call_args_list) == [
+        'node-1',
+        'node-2',
+        'node-3',
+    ]
+    assert threading.current_thread().name not in lookup_threads
+    assert node_bulk_assign.call_args_list == [
+        mock.call(
+            simulation='sim-1',
+            nodes=[
+                {'node': 'node-1', 'user_data': 'ud-1'},
+                {'node': 'node-1', 'meta_data': 'md-1'},
+                {'node': 'node-3', 'user_data': 'ud-3'},
+            ],
+        ),
+        mock.call(
+            simulation='sim-2',
+            nodes=[
+                {'node': 'node-2', 'user_data': 'ud-2'},
+                {'node': 'node-2', 'meta_data': 'md-2'},
+            ],
+        ),
+    ]
+
+
+def test_bulk_assign_keeps_order_when_lookups_finish_out_of_order(
+    api: AirApi,
+    cloud_init_api: CloudInitEndpointAPI,
+    make_node: Callable[[str, str], Node],
+) -> None:
+    last_lookup_done = threading.Event()
+
+    def get_node(pk: str) -> Node:
+        # node-1 is requested first but only returns once node-3 has been resolved
+        if pk == 'node-1':
+            assert last_lookup_done.wait(timeout=5)
+        node = make_node(pk, 'sim-1')
+        if pk == 'node-3':
+            last_lookup_done.set()
+        return node
+
+    with (
+        mock.patch.object(api.nodes, 'get', side_effect=get_node),
+        mock.patch.object(api.simulations, 'node_bulk_assign') as node_bulk_assign,
+    ):
+        cloud_init_api.bulk_assign(
+            [
+                {'simulation_node': 'node-1', 'user_data': 'ud-1'},
+                {'simulation_node': 'node-2', 'user_data': 'ud-2'},
+                {'simulation_node': 'node-3', 'user_data': 'ud-3'},
+            ]
+        )
+
+    node_bulk_assign.assert_called_once_with(
+        simulation='sim-1',
+        nodes=[
+            {'node': 'node-1', 'user_data': 'ud-1'},
+            {'node': 'node-2', 'user_data': 'ud-2'},
+            {'node': 'node-3', 'user_data': 'ud-3'},
+        ],
+    )
+
+
+def test_bulk_assign_caps_lookup_workers(
+    monkeypatch: pytest.MonkeyPatch,
+    api: AirApi,
+    cloud_init_api: CloudInitEndpointAPI,
+    make_node: Callable[[str, str], Node],
+) -> None:
+    monkeypatch.setattr(const, 'MAX_NODE_LOOKUP_WORKERS', 2)
+
+    with (
+        mock.patch(
+            'air_sdk.bc.cloud_init.ThreadPoolExecutor', wraps=ThreadPoolExecutor
+        ) as executor_cls,
+        mock.patch.object(
+            api.nodes, 'get', side_effect=lambda pk: make_node(pk, 'sim-1')
+        ),
+        mock.patch.object(api.simulations, 'node_bulk_assign'),
+    ):
+        cloud_init_api.bulk_assign(
+            [{'simulation_node': f'node-{i}', 'user_data': 'ud'} for i in range(5)]
+        )
+
+    executor_cls.assert_called_once_with(max_workers=2)
+
+
+def test_bulk_assign_resolves_a_single_node_inline(
+    api: AirApi,
+    cloud_init_api: CloudInitEndpointAPI,
+    make_node: Callable[[str, str], Node],
+) -> None:
+    with (
+        mock.patch('air_sdk.bc.cloud_init.ThreadPoolExecutor') as executor_cls,
+        mock.patch.object(
+            api.nodes, 'get', side_effect=lambda pk: make_node(pk, 'sim-1')
+        ) as nodes_get,
+        mock.patch.object(api.simulations, 'node_bulk_assign') as node_bulk_assign,
+    ):
+        cloud_init_api.bulk_assign(
+            [
+                {'simulation_node': 'node-1', 'user_data': 'ud-1'},
+                {'simulation_node': 'node-1', 'meta_data': 'md-1'},
+            ]
+        )
+
+    executor_cls.assert_not_called()
+    nodes_get.assert_called_once_with('node-1')
+    node_bulk_assign.assert_called_once_with(
+        simulation='sim-1',
+        nodes=[
+            {'node': 'node-1', 'user_data': 'ud-1'},
+            {'node': 'node-1', 'meta_data': 'md-1'},
+        ],
+    )
+
+
+def test_bulk_assign_accepts_node_objects(
+    api: AirApi,
+    cloud_init_api: CloudInitEndpointAPI,
+    make_node: Callable[[str, str], Node],
+) -> None:
+    node = make_node('node-1', 'sim-1')
+    with (
+        mock.patch.object(api.nodes, 'get') as nodes_get,
+        mock.patch.object(api.simulations, 'node_bulk_assign') as node_bulk_assign,
+    ):
+        cloud_init_api.bulk_assign([{'simulation_node': node, 'user_data': 'ud-1'}])
+
+    nodes_get.assert_not_called()
+    node_bulk_assign.assert_called_once_with(
+        simulation='sim-1', nodes=[{'node': node, 'user_data': 'ud-1'}]
+    )
+
+
+def test_bulk_assign_groups_node_objects_with_their_ids(
+    api: AirApi,
+    cloud_init_api: CloudInitEndpointAPI,
+    make_node: Callable[[str, str], Node],
+) -> None:
+    node = make_node('node-1', 'sim-1')
+    with (
+        mock.patch.object(
+            api.nodes, 'get', side_effect=lambda pk: make_node(pk, 'sim-2')
+        ) as nodes_get,
+        mock.patch.object(api.simulations, 'node_bulk_assign') as node_bulk_assign,
+    ):
+        cloud_init_api.bulk_assign(
+            [
+                {'simulation_node': node, 'user_data': 'ud-1'},
+                {'simulation_node': 'node-2', 'user_data': 'ud-2'},
+                {'simulation_node': 'node-1', 'meta_data': 'md-1'},
+            ]
+        )
+
+    # The Node instance is reused for 'node-1'; only 'node-2' is fetched
+    nodes_get.assert_called_once_with('node-2')
+    assert node_bulk_assign.call_args_list == [
+        mock.call(
+            simulation='sim-1',
+            nodes=[
+                {'node': node, 'user_data': 'ud-1'},
+                {'node': 'node-1', 'meta_data': 'md-1'},
+            ],
+        ),
+        mock.call(simulation='sim-2', nodes=[{'node': 'node-2', 'user_data': 'ud-2'}]),
+    ]
+
+
+def test_bulk_assign_requires_simulation_node(
+    cloud_init_api: CloudInitEndpointAPI,
+) -> None:
+    with pytest.raises(ValueError, match='simulation_node'):
+        cloud_init_api.bulk_assign([{'user_data': 'ud-1'}])  # type: ignore[typeddict-item]
+
+
+def test_bulk_assign_walks_iterator_input_once(
+    api: AirApi,
+    cloud_init_api: CloudInitEndpointAPI,
+    make_node: Callable[[str, str], Node],
+) -> None:
+    assignments = iter(
+        [
+            {'simulation_node': make_node('node-1', 'sim-1'), 'user_data': 'ud-1'},
+            {'simulation_node': make_node('node-1', 'sim-1'), 'meta_data': 'md-1'},
+        ]
+    )
+    with mock.patch.object(api.simulations, 'node_bulk_assign') as node_bulk_assign:
+        cloud_init_api.bulk_assign(assignments)  # type: ignore[arg-type]
+
+    (call,) = node_bulk_assign.call_args_list
+    assert call.kwargs['simulation'] == 'sim-1'
+    assert [list(assignment) for assignment in call.kwargs['nodes']] == [
+        ['user_data', 'node'],
+        ['meta_data', 'node'],
+    ]
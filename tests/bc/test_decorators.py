@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import warnings
+from unittest import mock
+
+import pytest
+
+from air_sdk.bc import reset_deprecation_warnings
+from air_sdk.bc.decorators import deprecated
+
+
+def test_deprecated_warns_on_first_call_only() -> None:
+    @deprecated('old_function() is deprecated')
+    def old_function(value: int) -> int:
+        return value * 2
+
+    with pytest.warns(DeprecationWarning, match=r'old_function\(\) is deprecated'):
+        assert old_function(1) == 2
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert old_function(2) == 4
+
+
+def test_deprecated_warns_after_a_suppressed_first_call() -> None:
+    @deprecated('old_function() is deprecated')
+    def old_function(value: int) -> int:
+        return value * 2
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        assert old_function(1) == 2
+
+    with pytest.warns(DeprecationWarning, match=r'old_function\(\) is deprecated'):
+        assert old_function(2) == 4
+
+
+def test_deprecated_functions_warn_independently() -> None:
+    class Widget:
+        @deprecated('Widget.first() is deprecated')
+        def first(self) -> str:
+            return 'first'
+
+        @property
+        @deprecated('Widget.second is deprecated')
+        def second(self) -> str:
+            return 'second'
+
+    widget = Widget()
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        for _ in range(3):
+            assert widget.first() == 'first'
+            assert widget.second == 'second'
+
+    assert [str(warning.message) for warning in caught] == [
+        'Widget.first() is deprecated',
+        'Widget.second is deprecated',
+    ]
+
+
+def test_deprecated_method_stays_wrapped_after_first_call() -> None:
+    class Widget:
+        @deprecated('Widget.old() is deprecated')
+        def old(self, value: int) -> int:
+            return value + 1
+
+    wrapper = Widget.__dict__['old']
+    with pytest.warns(DeprecationWarning, match=r'Widget.old\(\) is deprecated'):
+        assert Widget().old(1) == 2
+
+    assert Widget.__dict__['old'] is wrapper
+    assert wrapper.__wrapped__(Widget(), 2) == 3
+
+    # The deprecated method can still be patched and warns again after a reset
+    with mock.patch.object(Widget, 'old', return_value=0):
+        assert Widget().old(1) == 0
+    assert Widget.__dict__['old'] is wrapper
+    reset_deprecation_warnings()
+    with pytest.warns(DeprecationWarning, match=r'Widget.old\(\) is deprecated'):
+        assert Widget().old(2) == 3
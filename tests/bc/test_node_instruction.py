@@ -0,0 +1,29 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from air_sdk.bc.node_instruction import _convert_data_field_to_dict
+
+
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+def test_convert_data_field_to_dict_uses_executor_converter() -> None:
+    kwargs = {'executor': 'shell', 'data': 'echo hello'}
+
+    _convert_data_field_to_dict(kwargs)
+
+    assert kwargs['data'] == {'commands': ['echo hello']}
+
+
+@pytest.mark.parametrize('executor', [None, 'unknown', ['shell'], {'type': 'shell'}])
+def test_convert_data_field_to_dict_skips_unknown_executors(executor: Any) -> None:
+    kwargs = {'executor': executor, 'data': 'echo hello'}
+
+    _convert_data_field_to_dict(kwargs)
+
+    assert kwargs['data'] == 'echo hello'
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, Iterator
+from unittest import mock
+
+import pytest
+
+from air_sdk import AirApi, const
+from air_sdk.endpoints.services import ServiceEndpointAPI
+
+
+@pytest.fixture
+def service_api(api: AirApi) -> ServiceEndpointAPI:
+    return ServiceEndpointAPI(api)
+
+
+@pytest.fixture
+def list_mocks(api: AirApi) -> Iterator[tuple[mock.MagicMock, mock.MagicMock]]:
+    """Serve node 'node-<name>' and interface '<node>/<name>' for any lookup."""
+
+    def list_nodes(**params: Any) -> Iterator[SimpleNamespace]:
+        return iter([SimpleNamespace(id=f'node-{params["name"]}')])
+
+    def list_interfaces(**params: Any) -> Iterator[SimpleNamespace]:
+        return iter([SimpleNamespace(id=f'{params["node"]}/{params["name"]}')])
+
+    with (
+        mock.patch.object(api.nodes, 'list', side_effect=list_nodes) as nodes_list,
+        mock.patch.object(
+            api.interfaces, 'list', side_effect=list_interfaces
+        ) as interfaces_list,
+    ):
+        yield nodes_list, interfaces_list
+
+
+def test_resolve_interface_string_is_cached(
+    service_api: ServiceEndpointAPI,
+    list_mocks: tuple[mock.MagicMock, mock.MagicMock],
+) -> None:
+    nodes_list, interfaces_list = list_mocks
+
+    assert service_api._resolve_interface_string('r1:eth0', 'sim-1') == 'node-r1/eth0'
+    assert service_api._resolve_interface_string('r1:eth0', 'sim-1') == 'node-r1/eth0'
+
+    nodes_list.assert_called_once_with(simulation='sim-1', name='r1', limit=1)
+    interfaces_list.assert_called_once_with(node='node-r1', name='eth0', limit=1)
+
+
+def test_resolve_interface_string_is_scoped_by_simulation(
+    service_api: ServiceEndpointAPI,
+    list_mocks: tuple[mock.MagicMock, mock.MagicMock],
+) -> None:
+    nodes_list, _ = list_mocks
+
+    service_api._resolve_interface_string('r1:eth0', 'sim-1')
+    service_api._resolve_interface_string('r1:eth0', 'sim-2')
+
+    assert nodes_list.call_count == 2
+
+
+def test_resolve_interface_string_evicts_least_recently_used(
+    monkeypatch: pytest.MonkeyPatch,
+    service_api: ServiceEndpointAPI,
+    list_mocks: tuple[mock.MagicMock, mock.MagicMock],
+) -> None:
+    monkeypatch.setattr(const, 'MAX_INTERFACE_RESOLVE_CACHE_SIZE', 2)
+    nodes_list, _ = list_mocks
+
+    for interface_str in ('r1:eth0', 'r2:eth0', 'r1:eth0', 'r3:eth0'):
+        service_api._resolve_interface_string(interface_str, 'sim-1')
+    assert nodes_list.call_count == 3
+
+    # r1 was used more recently than r2, so r2 is the entry that was evicted
+    service_api._resolve_interface_string('r1:eth0', 'sim-1')
+    assert nodes_list.call_count == 3
+    service_api._resolve_interface_string('r2:eth0', 'sim-1')
+    assert nodes_list.call_count == 4
+    assert len(service_api._interface_id_cache) == 2
+
+
+def test_resolve_interface_string_does_not_cache_misses(
+    api: AirApi, service_api: ServiceEndpointAPI
+) -> None:
+    with mock.patch.object(api.nodes, 'list', return_value=iter([])) as nodes_list:
+        with pytest.raises(ValueError, match='Node "r1" not found'):
+            service_api._resolve_interface_string('r1:eth0', 'sim-1')
+
+    nodes_list.assert_called_once()
+    assert not service_api._interface_id_cache
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import warnings
+from unittest import mock
+
+import pytest
+
+from air_sdk import AirApi
+from air_sdk.bc.simulation import SimulationState
+from air_sdk.endpoints import mixins
+from air_sdk.endpoints.simulations import SimulationEndpointAPI
+
+
+def test_state_alias_warns_once_per_alias() -> None:
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        assert SimulationState('ACTIVE') == 'LOADED'
+        assert SimulationState('REBUILDING') == 'LOADED'
+        assert SimulationState('INACTIVE') == 'STORED'
+        assert SimulationState('INACTIVE') == 'STORED'
+
+    messages = [str(warning.message) for warning in caught]
+    assert len(messages) == 2
+    assert messages[0].startswith("Simulation state 'LOADED' is deprecated")
+    assert messages[1].startswith("Simulation state 'STORED' is deprecated")
+
+
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+@pytest.mark.parametrize(
+    ('state', 'alias', 'expected'),
+    [
+        ('ACTIVE', 'LOADED', True),
+        ('BOOTING', 'LOADING', True),
+        ('INACTIVE', 'NEW', True),
+        ('DEMO', 'SNAPSHOT', True),
+        ('ACTIVE', 'STORED', False),
+        ('INACTIVE', 'LOADED', False),
+    ],
+)
+def test_state_alias_matches_new_states(state: str, alias: str, expected: bool) -> None:
+    assert (SimulationState(state) == alias) is expected
+    assert (SimulationState(state) != alias) is not expected
+
+
+def test_state_direct_comparison_does_not_warn() -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert SimulationState('ACTIVE') == 'ACTIVE'
+        assert SimulationState('ACTIVE') != 'INACTIVE'
+        assert SimulationState('ACTIVE') != 1
+        assert hash(SimulationState('ACTIVE')) == hash('ACTIVE')
+
+
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+def test_list_normalizes_legacy_filters(api: AirApi) -> None:
+    with mock.patch.object(mixins.ListApiMixin, 'list') as base_list:
+        SimulationEndpointAPI(api).list(
+            title='sim', organization='org', disable_auto_oob_dhcp=True, state='ACTIVE'
+        )
+
+    base_list.assert_called_once_with(name='sim', enable_dhcp=False, state='ACTIVE')
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import warnings
+
+import pytest
+
+from air_sdk.bc import reset_deprecation_warnings
+from air_sdk.bc.utils import deprecation_warn_once
+
+
+def test_deprecation_warn_once_warns_once_per_key() -> None:
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        deprecation_warn_once('key-a', 'a is deprecated')
+        deprecation_warn_once('key-a', 'a is deprecated')
+        deprecation_warn_once('key-b', 'b is deprecated')
+        deprecation_warn_once('key-a', 'a is deprecated')
+
+    assert [str(warning.message) for warning in caught] == [
+        'a is deprecated',
+        'b is deprecated',
+    ]
+    assert all(warning.category is DeprecationWarning for warning in caught)
+
+
+def test_deprecation_warn_once_points_at_the_caller() -> None:
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        deprecation_warn_once('key-c', 'c is deprecated')
+
+    (warning,) = caught
+    assert warning.filename == __file__
+
+
+def test_deprecation_warn_once_survives_a_suppressed_first_hit() -> None:
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('ignore')
+        deprecation_warn_once('key-d', 'd is deprecated')
+        warnings.simplefilter('always')
+        deprecation_warn_once('key-d', 'd is deprecated')
+        deprecation_warn_once('key-d', 'd is deprecated')
+
+    assert [str(warning.message) for warning in caught] == ['d is deprecated']
+
+
+def test_deprecation_warn_once_respects_the_default_filters() -> None:
+    with warnings.catch_warnings(record=True) as caught:
+        # The interpreter's defaults only show DeprecationWarning for __main__
+        warnings.resetwarnings()
+        warnings.filterwarnings('default', category=DeprecationWarning, module='__main__')
+        warnings.filterwarnings('ignore', category=DeprecationWarning)
+        deprecation_warn_once('key-e', 'e is deprecated')
+        assert not caught
+
+        warnings.filterwarnings('always', category=DeprecationWarning, module=__name__)
+        deprecation_warn_once('key-e', 'e is deprecated')
+
+    assert [str(warning.message) for warning in caught] == ['e is deprecated']
+
+
+def test_deprecation_warn_once_matches_filters_by_message() -> None:
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        warnings.filterwarnings('ignore', message='f is', category=DeprecationWarning)
+        deprecation_warn_once('key-f', 'f is deprecated')
+        deprecation_warn_once('key-g', 'g is deprecated')
+
+    assert [str(warning.message) for warning in caught] == ['g is deprecated']
+
+
+def test_deprecation_warn_once_raises_every_time_under_error_filter() -> None:
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        for _ in range(2):
+            with pytest.raises(DeprecationWarning, match='h is deprecated'):
+                deprecation_warn_once('key-h', 'h is deprecated')
+
+
+def test_reset_deprecation_warnings_warns_again() -> None:
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        deprecation_warn_once('key-i', 'i is deprecated')
+        deprecation_warn_once('key-i', 'i is deprecated')
+        reset_deprecation_warnings()
+        deprecation_warn_once('key-i', 'i is deprecated')
+
+    assert [str(warning.message) for warning in caught] == [
+        'i is deprecated',
+        'i is deprecated',
+    ]
@@ -0,0 +1,51 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Callable
+
+import pytest
+
+from air_sdk import AirApi
+from air_sdk.endpoints import Node
+
+
+@pytest.fixture
+def api() -> AirApi:
+    return AirApi(authenticate=False)
+
+
+@pytest.fixture
+def make_node(api: AirApi) -> Callable[[str, str], Node]:
+    """Build a `Node` whose `simulation` is the given simulation ID."""
+    now = datetime.now(timezone.utc)
+
+    def _make_node(node_id: str, simulation_id: str) -> Node:
+        return Node(
+            _api=api,
+            id=node_id,
+            created=now,
+            modified=now,
+            name=node_id,
+            simulation=simulation_id,  # type: ignore[arg-type]
+            image='image',  # type: ignore[arg-type]
+            category='VM',
+            state='RUNNING',
+            status_from_worker='',
+            split_options=None,
+            cpu=1,
+            memory=1024,
+            storage=10,
+            pos_x=0,
+            pos_y=0,
+            cdrom=None,
+            storage_pci=None,
+            labels=None,
+            metadata=None,
+            advanced={},
+        )
+
+    return _make_node
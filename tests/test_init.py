@@ -0,0 +1,42 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES.
+# All rights reserved.
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pytest
+
+import air_sdk
+from air_sdk import endpoints
+
+
+def test_import_does_not_load_endpoints() -> None:
+    code = 'import sys, air_sdk; sys.exit("air_sdk.endpoints" in sys.modules)'
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_lazy_export_is_resolved_and_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delitem(vars(air_sdk), 'NodeEndpointAPI', raising=False)
+    monkeypatch.delitem(vars(air_sdk), 'NodeApi', raising=False)
+
+    assert air_sdk.NodeApi is endpoints.NodeEndpointAPI
+    # Both the alias and its canonical name are cached on the module
+    assert vars(air_sdk)['NodeApi'] is endpoints.NodeEndpointAPI
+    assert vars(air_sdk)['NodeEndpointAPI'] is endpoints.NodeEndpointAPI
+
+
+@pytest.mark.parametrize('name', air_sdk.__all__)
+def test_all_exports_resolve(name: str) -> None:
+    assert getattr(air_sdk, name) is not None
+
+
+def test_dir_lists_lazy_exports() -> None:
+    assert {'SimulationEndpointAPI', 'SimulationApi', '__version__'} <= set(dir(air_sdk))
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError, match='NotAnEndpoint'):
+        air_sdk.NotAnEndpoint